@@ -206,7 +206,7 @@ cleanup_resources() {
     docker rmi sports-prediction-bot:test 2>/dev/null || true
     
     # Clean up test files
-    rm -f test_results.json test_output.log test_report.html
+    rm -f test_results.json test_results.jsonl test_output.log test_report.html
     
     print_success "Cleanup completed"
 }
@@ -121,7 +121,8 @@ Memory Usage: $(free -h)
     
     <h2>Test Files</h2>
     <ul>
-        <li><a href="test_results.json">Detailed Test Results (JSON)</a></li>
+        <li><a href="test_results.json">Test Results Summary (JSON)</a></li>
+        <li><a href="test_results.jsonl">Detailed Test Results (JSON Lines)</a></li>
         <li><a href="test_output.log">Full Test Output</a></li>
     </ul>
 </body>
@@ -133,6 +134,7 @@ if [ -n "$S3_BUCKET" ]; then
     echo "Uploading results to S3..."
     aws s3 cp test_report.html s3://$S3_BUCKET/test-reports/$(date +%Y%m%d-%H%M%S)/
     aws s3 cp test_results.json s3://$S3_BUCKET/test-reports/$(date +%Y%m%d-%H%M%S)/
+    aws s3 cp test_results.jsonl s3://$S3_BUCKET/test-reports/$(date +%Y%m%d-%H%M%S)/
     aws s3 cp test_output.log s3://$S3_BUCKET/test-reports/$(date +%Y%m%d-%H%M%S)/
 fi
 
@@ -6,15 +6,175 @@ Designed to run in clean environments with full dependency testing.
 
 import os
 import sys
+import asyncio
 import subprocess
+import hashlib
+import inspect
+import mmap
+import multiprocessing
+import re
 import time
 import json
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # not installed before the dependency step has run
+    orjson = None
+
+try:
+    import yaml
+except ImportError:  # not installed before the dependency step has run
+    yaml = None
+
+# Tests are mostly I/O bound (pip, file checks, DB pings); leave headroom for the
+# subprocesses they spawn but never drop below two concurrent workers.
+MAX_WORKERS = max(2, (os.cpu_count() or 4) - 2)
+
+# Persistent pip wheel cache and the stamp recording the last dependency set
+# installed successfully; together they make repeat runs near-instant.
+PIP_CACHE_DIR = Path('.pip-cache')
+
+# Summary report and the per-test record stream written as tests complete
+RESULTS_FILE = Path('test_results.json')
+RESULTS_STREAM_FILE = Path('test_results.jsonl')
+DEPS_STAMP_FILE = Path('.deps-stamp')
+CORE_DEPS = [
+    'click', 'pydantic', 'pydantic-settings', 
+    'python-dotenv', 'fastapi', 'uvicorn'
+]
+
+# Repository paths nested deeper than this are never checked by the tests
+MAX_SCAN_DEPTH = 4
+SKIP_DIRS = {'.git', '__pycache__', '.pip-cache', 'node_modules', '.venv', 'venv'}
+
+
+@lru_cache(maxsize=None)
+def _present_paths(root='.'):
+    """Collect relative paths under root with one scandir pass per directory."""
+    present = set()
+    pending = [(root, '', 1)]
+    while pending:
+        directory, prefix, depth = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel_path = f"{prefix}{entry.name}"
+                    present.add(rel_path)
+                    if (depth < MAX_SCAN_DEPTH and entry.name not in SKIP_DIRS
+                            and entry.is_dir(follow_symlinks=False)):
+                        pending.append((entry.path, f"{rel_path}/", depth + 1))
+        except OSError:
+            continue
+    return frozenset(present)
+
+
+def _exists(path):
+    """Check whether a repository file exists using the cached path index."""
+    return Path(path).as_posix() in _present_paths()
+
+
+if yaml is not None:
+    class _CloudFormationLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+        """Safe YAML loader that accepts CloudFormation intrinsic tags (!Ref, !Sub, ...)."""
+
+    # Intrinsic function values are irrelevant to the structural check
+    _CloudFormationLoader.add_multi_constructor('!', lambda loader, suffix, node: None)
+
+
+def _get_pool_context():
+    """Get the multiprocessing context for the test worker pool.
+
+    Where available, workers fork from a forkserver that has already
+    imported this module and the stdlib modules the tests use, instead of
+    each starting a fresh interpreter. Application modules such as settings
+    are deliberately not preloaded: tests import them after writing .env.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context()
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload(['__main__', 'asyncio', 'json', 'subprocess'])
+    return ctx
+
+
+def _ensure_src_on_path():
+    """Make the package importable without growing sys.path on every call."""
+    if 'src' not in sys.path:
+        sys.path.insert(0, 'src')
+
+
+def _load_json_file(path):
+    """Parse a JSON file, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _dump_json_line(record):
+    """Serialize a record as one JSON Lines entry."""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return json.dumps(record).encode() + b'\n'
+
+
+def _missing_needles(path, needles):
+    """Return the needles that do not occur in a file.
+
+    All needles are matched in one pass of a compiled alternation over a
+    memory-mapped view of the file, instead of one substring scan each.
+    """
+    missing = set(needles)
+    pattern = re.compile(b'|'.join(re.escape(needle.encode()) for needle in needles))
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return missing
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in pattern.finditer(mm):
+                missing.discard(match.group().decode())
+                if not missing:
+                    break
+    return missing
+
+
+@lru_cache(maxsize=None)
+def _pip_available():
+    """Probe ``pip --version`` once per process."""
+    # -I skips user site-packages and PYTHON* env handling; -S is not an
+    # option because pip itself lives in site-packages
+    result = subprocess.run([sys.executable, '-I', '-m', 'pip', '--version'],
+                            capture_output=True)
+    return result.returncode == 0
+
+
+# Top-level packages of this project; a missing module from one of these is
+# a real bug, while any other missing module is a third-party dependency
+FIRST_PARTY_PACKAGES = {'sports_prediction', 'src'}
+
+
+def _is_missing_dependency(error):
+    """Check whether an error is a probe hitting an uninstalled third-party package.
+
+    These are reported without formatting a traceback; every other error,
+    including an ImportError raised inside this project, keeps its traceback.
+    """
+    return (isinstance(error, ModuleNotFoundError)
+            and (error.name or '').partition('.')[0] not in FIRST_PARTY_PACKAGES)
+
+
+# Innermost frames kept when recording an unexpected error's traceback
+TRACEBACK_LIMIT = 5
+
+
 class RemoteTestSuite:
     def __init__(self):
+        # Log prefix cache; the timestamp only changes once per second
+        self._log_second = None
+        self._log_timestamp = ''
         self.results = {
             'start_time': datetime.now().isoformat(),
             'environment': self.get_environment_info(),
@@ -36,48 +196,96 @@ class RemoteTestSuite:
     
     def log(self, message, level='INFO'):
         """Log a message with timestamp."""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] {level}: {message}")
+        now = int(time.time())
+        if now != self._log_second:
+            self._log_second = now
+            self._log_timestamp = time.strftime('%H:%M:%S', time.localtime(now))
+        print(f"[{self._log_timestamp}] {level}: {message}")
     
     def run_test(self, test_name, test_func):
-        """Run a single test and record results."""
-        self.test_count += 1
+        """Run a single test and return its result record.
+
+        This runs inside a worker process, so it must not mutate suite state;
+        the parent merges the returned record via ``record_result``.
+        """
         self.log(f"Running test: {test_name}")
         
         start_time = time.time()
         try:
-            result = test_func()
+            if inspect.iscoroutinefunction(test_func):
+                result = asyncio.run(test_func())
+            else:
+                result = test_func()
             duration = time.time() - start_time
             
             if result:
-                self.passed_count += 1
                 self.log(f"✅ PASSED: {test_name} ({duration:.2f}s)", 'PASS')
                 status = 'PASSED'
             else:
                 self.log(f"❌ FAILED: {test_name} ({duration:.2f}s)", 'FAIL')
                 status = 'FAILED'
             
-            self.results['tests'][test_name] = {
+            return {
                 'status': status,
                 'duration': duration,
                 'error': None
             }
-            return result
             
         except Exception as e:
             duration = time.time() - start_time
             error_msg = str(e)
             self.log(f"❌ ERROR: {test_name} - {error_msg} ({duration:.2f}s)", 'ERROR')
             
-            self.results['tests'][test_name] = {
+            entry = {
                 'status': 'ERROR',
                 'duration': duration,
-                'error': error_msg,
-                'traceback': traceback.format_exc()
+                'error': error_msg
             }
-            return False
+            # Formatting walks every frame and reads source off disk, so only
+            # pay for it when the failure is unexpected
+            if not _is_missing_dependency(e):
+                entry['traceback'] = traceback.format_exc(limit=-TRACEBACK_LIMIT)
+            return entry
+    
+    def record_result(self, test_name, entry):
+        """Merge a test result record into the suite results.
+
+        The full record (error, traceback) is appended to the results
+        stream right away; only status and duration are kept in memory.
+        """
+        self.test_count += 1
+        if entry['status'] == 'PASSED':
+            self.passed_count += 1
+        
+        with open(RESULTS_STREAM_FILE, 'ab') as f:
+            f.write(_dump_json_line({'name': test_name, **entry}))
+        
+        self.results['tests'][test_name] = {
+            'status': entry['status'],
+            'duration': entry['duration']
+        }
+    
+    async def run_stage(self, executor, tests):
+        """Run a group of independent tests concurrently."""
+        loop = asyncio.get_running_loop()
+        entries = await asyncio.gather(
+            *[loop.run_in_executor(executor, self.run_test, test_name, test_func)
+              for test_name, test_func in tests],
+            return_exceptions=True
+        )
+        
+        # gather preserves declaration order so the report stays stable
+        for (test_name, _), entry in zip(tests, entries):
+            if isinstance(entry, Exception):
+                # The worker itself died (e.g. unpicklable result)
+                entry = {
+                    'status': 'ERROR',
+                    'duration': 0.0,
+                    'error': str(entry)
+                }
+            self.record_result(test_name, entry)
     
-    def test_python_environment(self):
+    async def test_python_environment(self):
         """Test Python environment."""
         # Check Python version
         if sys.version_info < (3, 8):
@@ -85,43 +293,80 @@ class RemoteTestSuite:
             return False
         
         # Check pip
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', '--version'], 
-                         check=True, capture_output=True)
-        except subprocess.CalledProcessError:
+        if not await asyncio.to_thread(_pip_available):
             self.log("pip not available", 'ERROR')
             return False
         
         return True
     
-    def test_dependency_installation(self):
+    def get_pip_env(self):
+        """Get the environment for pip subprocesses."""
+        env = os.environ.copy()
+        env['PIP_CACHE_DIR'] = str(PIP_CACHE_DIR.resolve())
+        env['PIP_DISABLE_PIP_VERSION_CHECK'] = '1'
+        return env
+    
+    def get_dependency_hash(self):
+        """Hash the dependency set this suite installs."""
+        digest = hashlib.sha256(' '.join(CORE_DEPS).encode())
+        if _exists('requirements.txt'):
+            digest.update(Path('requirements.txt').read_bytes())
+        return digest.hexdigest()
+    
+    async def run_pip(self, *args, timeout=None):
+        """Run pip with the shared cache, returning (returncode, stderr)."""
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, '-m', 'pip', *args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            env=self.get_pip_env()
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stderr.decode(errors='replace')
+    
+    async def test_dependency_installation(self):
         """Test dependency installation."""
         try:
-            # Install core dependencies first
-            core_deps = [
-                'click', 'pydantic', 'pydantic-settings', 
-                'python-dotenv', 'fastapi', 'uvicorn'
-            ]
+            deps_hash = self.get_dependency_hash()
+            
+            # Skip reinstalling when nothing changed since the last good run
+            if DEPS_STAMP_FILE.exists() and DEPS_STAMP_FILE.read_text().strip() == deps_hash:
+                returncode, _ = await self.run_pip('check')
+                if returncode == 0:
+                    self.log("Dependencies up to date, skipping installation")
+                    return True
             
-            for dep in core_deps:
-                subprocess.run([sys.executable, '-m', 'pip', 'install', dep], 
-                             check=True, capture_output=True)
+            # One pip invocation resolves everything together and pays
+            # interpreter and resolver start-up only once
+            returncode, stderr = await self.run_pip('install', '--prefer-binary', *CORE_DEPS)
+            
+            if returncode != 0:
+                self.log(f"Core dependency installation failed: {stderr}", 'ERROR')
+                return False
             
             # Try to install from requirements.txt
-            if Path('requirements.txt').exists():
+            if _exists('requirements.txt'):
                 self.log("Installing from requirements.txt...")
-                result = subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], 
-                                      capture_output=True, text=True, timeout=600)
+                try:
+                    returncode, stderr = await self.run_pip(
+                        'install', '--prefer-binary', '-r', 'requirements.txt', timeout=600
+                    )
+                except asyncio.TimeoutError:
+                    self.log("Dependency installation timed out", 'ERROR')
+                    return False
                 
-                if result.returncode != 0:
-                    self.log(f"Requirements installation had issues: {result.stderr}")
+                if returncode != 0:
+                    self.log(f"Requirements installation had issues: {stderr}")
                     # Continue anyway - some dependencies might be optional
+                    return True
             
+            DEPS_STAMP_FILE.write_text(deps_hash)
             return True
             
-        except subprocess.TimeoutExpired:
-            self.log("Dependency installation timed out", 'ERROR')
-            return False
         except Exception as e:
             self.log(f"Dependency installation failed: {e}", 'ERROR')
             return False
@@ -136,7 +381,7 @@ class RemoteTestSuite:
         ]
         
         for file_path in required_files:
-            if not Path(file_path).exists():
+            if not _exists(file_path):
                 self.log(f"Missing required file: {file_path}", 'ERROR')
                 return False
         
@@ -157,11 +402,16 @@ LOG_LEVEL=INFO
 DEBUG=True
 TESTING=True
 """
-            with open('.env', 'w') as f:
-                f.write(env_content)
+            # Only touch .env when its content differs, to avoid waking
+            # file watchers on every run
+            env_file = Path('.env')
+            desired = env_content.encode()
+            existing = env_file.read_bytes() if env_file.exists() else b''
+            if existing != desired:
+                env_file.write_bytes(desired)
             
             # Test settings import
-            sys.path.insert(0, 'src')
+            _ensure_src_on_path()
             from sports_prediction.config.settings import settings
             
             # Validate settings
@@ -180,7 +430,7 @@ TESTING=True
     def test_core_imports(self):
         """Test core module imports."""
         try:
-            sys.path.insert(0, 'src')
+            _ensure_src_on_path()
             
             # Test basic imports
             import sports_prediction
@@ -203,16 +453,14 @@ TESTING=True
         """Test CLI structure."""
         try:
             cli_file = Path('src/sports_prediction/cli/main.py')
-            if not cli_file.exists():
+            if not _exists(cli_file):
                 return False
             
-            # Read CLI file and check for commands
-            with open(cli_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
+            # Scan CLI file for commands
             expected_commands = ['run-bot', 'setup', 'status', 'predict']
+            missing = _missing_needles(cli_file, expected_commands)
             for command in expected_commands:
-                if command not in content:
+                if command in missing:
                     self.log(f"Missing CLI command: {command}")
                     return False
             
@@ -227,24 +475,26 @@ TESTING=True
         try:
             # Test CloudFormation template
             cf_template = Path('infrastructure/infrastructure.yaml')
-            if not cf_template.exists():
+            if not _exists(cf_template):
                 return False
             
-            with open(cf_template, 'r') as f:
-                content = f.read()
-            
             required_sections = ['AWSTemplateFormatVersion', 'Parameters', 'Resources', 'Outputs']
-            for section in required_sections:
-                if section not in content:
+            if yaml is not None:
+                # Check real top-level keys rather than text that may sit in comments
+                template = yaml.load(cf_template.read_bytes(), Loader=_CloudFormationLoader)
+                if not isinstance(template, dict) or not set(required_sections).issubset(template):
                     return False
+            elif _missing_needles(cf_template, required_sections):
+                return False
             
-            # Test parameter files
+            # Test parameter files, validating them in parallel
             param_files = ['dev.json', 'staging.json', 'prod.json']
-            for param_file in param_files:
-                param_path = Path(f'infrastructure/parameters/{param_file}')
-                if param_path.exists():
-                    with open(param_path, 'r') as f:
-                        json.load(f)  # Validate JSON
+            param_paths = [
+                Path(f'infrastructure/parameters/{param_file}') for param_file in param_files
+            ]
+            param_paths = [param_path for param_path in param_paths if _exists(param_path)]
+            with ThreadPoolExecutor(max_workers=len(param_files)) as executor:
+                list(executor.map(_load_json_file, param_paths))  # Validate JSON
             
             return True
             
@@ -256,7 +506,7 @@ TESTING=True
         """Test Docker configuration."""
         try:
             # Check Dockerfile
-            if not Path('Dockerfile').exists():
+            if not _exists('Dockerfile'):
                 return False
             
             with open('Dockerfile', 'r') as f:
@@ -268,7 +518,7 @@ TESTING=True
             # Check docker-compose files
             compose_files = ['docker-compose.yml', 'docker-compose.dev.yml']
             for compose_file in compose_files:
-                if not Path(compose_file).exists():
+                if not _exists(compose_file):
                     self.log(f"Missing compose file: {compose_file}")
                     return False
             
@@ -278,27 +528,37 @@ TESTING=True
             self.log(f"Docker configuration test failed: {e}", 'ERROR')
             return False
     
-    def test_database_connections(self):
-        """Test database connection capabilities."""
+    async def ping_redis(self):
+        """Ping Redis (if available)."""
         try:
-            # Test Redis connection (if available)
+            import redis.asyncio as aioredis
+            r = aioredis.Redis(host='localhost', port=6379, decode_responses=True)
             try:
-                import redis
-                r = redis.Redis(host='localhost', port=6379, decode_responses=True)
-                r.ping()
-                self.log("Redis connection successful")
-            except:
-                self.log("Redis not available (expected in some environments)")
-            
-            # Test MongoDB connection (if available)
+                await asyncio.wait_for(r.ping(), timeout=1.0)
+            finally:
+                await r.close()
+            self.log("Redis connection successful")
+        except Exception:
+            self.log("Redis not available (expected in some environments)")
+    
+    async def ping_mongo(self):
+        """Ping MongoDB (if available)."""
+        try:
+            from motor.motor_asyncio import AsyncIOMotorClient
+            client = AsyncIOMotorClient('mongodb://localhost:27017/', serverSelectionTimeoutMS=1000)
             try:
-                import pymongo
-                client = pymongo.MongoClient('mongodb://localhost:27017/', serverSelectionTimeoutMS=1000)
-                client.server_info()
-                self.log("MongoDB connection successful")
-            except:
-                self.log("MongoDB not available (expected in some environments)")
-            
+                await client.server_info()
+            finally:
+                client.close()
+            self.log("MongoDB connection successful")
+        except Exception:
+            self.log("MongoDB not available (expected in some environments)")
+    
+    async def test_database_connections(self):
+        """Test database connection capabilities."""
+        try:
+            # Both probes time out after ~1s; race them instead of paying twice
+            await asyncio.gather(self.ping_redis(), self.ping_mongo())
             return True
             
         except Exception as e:
@@ -315,9 +575,13 @@ TESTING=True
             'success_rate': (self.passed_count / self.test_count * 100) if self.test_count > 0 else 0
         }
         
-        # Save detailed results
-        with open('test_results.json', 'w') as f:
-            json.dump(self.results, f, indent=2)
+        # Save summary; per-test details are already in the results stream
+        if orjson is not None:
+            with open(RESULTS_FILE, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(RESULTS_FILE, 'w') as f:
+                json.dump(self.results, f, indent=2)
         
         # Print summary
         print("\n" + "="*70)
@@ -338,28 +602,38 @@ TESTING=True
             print("⚠️ OVERALL: ISSUES FOUND - Review failed tests")
             return False
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all tests."""
         print("🚀 Starting Remote Test Suite for Sports Prediction Bot")
         print(f"Environment: {self.results['environment']['platform']}")
         print(f"Python: {sys.version.split()[0]}")
         
-        # Define test suite
-        tests = [
-            ("Python Environment", self.test_python_environment),
-            ("Project Structure", self.test_project_structure),
-            ("Dependency Installation", self.test_dependency_installation),
-            ("Configuration Loading", self.test_configuration_loading),
-            ("Core Imports", self.test_core_imports),
-            ("CLI Structure", self.test_cli_structure),
-            ("Infrastructure Files", self.test_infrastructure_files),
-            ("Docker Configuration", self.test_docker_configuration),
-            ("Database Connections", self.test_database_connections)
+        # Start a fresh results stream for this run
+        RESULTS_STREAM_FILE.write_bytes(b'')
+        
+        # Define test suite. Tests within a stage are independent and run
+        # concurrently; later stages need the dependencies installed earlier.
+        stages = [
+            [
+                ("Python Environment", self.test_python_environment),
+                ("Project Structure", self.test_project_structure),
+                ("Dependency Installation", self.test_dependency_installation),
+                ("CLI Structure", self.test_cli_structure),
+                ("Infrastructure Files", self.test_infrastructure_files),
+                ("Docker Configuration", self.test_docker_configuration)
+            ],
+            [
+                ("Configuration Loading", self.test_configuration_loading),
+                ("Core Imports", self.test_core_imports),
+                ("Database Connections", self.test_database_connections)
+            ]
         ]
         
         # Run tests
-        for test_name, test_func in tests:
-            self.run_test(test_name, test_func)
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS,
+                                 mp_context=_get_pool_context()) as executor:
+            for tests in stages:
+                await self.run_stage(executor, tests)
         
         # Generate report
         return self.generate_report()
@@ -367,7 +641,7 @@ TESTING=True
 def main():
     """Main function."""
     suite = RemoteTestSuite()
-    success = suite.run_all_tests()
+    success = asyncio.run(suite.run_all_tests())
     return 0 if success else 1
 
 if __name__ == "__main__":
@@ -4,9 +4,31 @@ Master test runner for Sports Prediction Bot project.
 Runs all available tests and provides comprehensive results.
 """
 
-import subprocess
+import asyncio
 import sys
-from pathlib import Path
+from collections import deque
+
+# The remote suite must run standalone, so it owns the shared path index
+from remote_testing.full_test_suite import _exists
+
+# Test scripts run concurrently by run_comprehensive_tests
+TEST_SCRIPTS = [
+    "test_basic.py",
+    "infrastructure/test-simple.ps1",
+    "test_cli_minimal.py"
+]
+
+# Lines of a passing script's output echoed in the summary
+TAIL_LINES = 3
+
+async def read_tail(stream, maxlen=TAIL_LINES):
+    """Read a subprocess stream to EOF, keeping only its last non-blank lines."""
+    tail = deque(maxlen=maxlen)
+    async for line in stream:
+        line = line.decode(errors='replace').rstrip('\r\n')
+        if line.strip():
+            tail.append(line)
+    return list(tail)
 
 def print_header(title):
     """Print a formatted header."""
@@ -20,41 +42,68 @@ def print_section(title):
     print(f"📋 {title}")
     print(f"{'─'*50}")
 
-def run_test_script(script_name, description):
-    """Run a test script and return success status."""
+async def run_test_script(script_name):
+    """Run a test script and return its outcome.
+
+    Printing is left to ``report_test_script`` so concurrent runs do not
+    interleave their output.
+    """
+    if not _exists(script_name):
+        return {'status': 'MISSING'}
+    
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, '-I', script_name,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            tail, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(read_tail(proc.stdout), proc.stderr.read(), proc.wait()),
+                timeout=120
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return {'status': 'TIMEOUT'}
+    except Exception as e:
+        return {'status': 'ERROR', 'error': str(e)}
+    
+    return {
+        'status': 'PASSED' if proc.returncode == 0 else 'FAILED',
+        'tail': tail,
+        'stderr': stderr.decode(errors='replace')
+    }
+
+async def run_test_scripts(script_names):
+    """Run test scripts concurrently, returning outcomes keyed by script."""
+    outcomes = await asyncio.gather(*[run_test_script(name) for name in script_names])
+    return dict(zip(script_names, outcomes))
+
+def report_test_script(outcome, script_name, description):
+    """Print the outcome of a test script and return success status."""
     print(f"\n🔄 Running {description}...")
     
-    if not Path(script_name).exists():
+    status = outcome['status']
+    if status == 'PASSED':
+        print(f"✅ {description} - PASSED")
+        # Print last few lines of output for summary
+        for line in outcome['tail']:
+            print(f"   {line}")
+        return True
+    elif status == 'FAILED':
+        print(f"❌ {description} - FAILED")
+        print(f"   Error: {outcome['stderr'].strip()}")
+    elif status == 'MISSING':
         print(f"❌ Test script not found: {script_name}")
-        return False
-    
-    try:
-        result = subprocess.run([sys.executable, script_name], 
-                              capture_output=True, text=True, timeout=120)
-        
-        if result.returncode == 0:
-            print(f"✅ {description} - PASSED")
-            # Print last few lines of output for summary
-            lines = result.stdout.strip().split('\n')
-            for line in lines[-3:]:
-                if line.strip():
-                    print(f"   {line}")
-            return True
-        else:
-            print(f"❌ {description} - FAILED")
-            print(f"   Error: {result.stderr.strip()}")
-            return False
-            
-    except subprocess.TimeoutExpired:
+    elif status == 'TIMEOUT':
         print(f"⏰ {description} - TIMEOUT")
-        return False
-    except Exception as e:
-        print(f"❌ {description} - ERROR: {e}")
-        return False
+    else:
+        print(f"❌ {description} - ERROR: {outcome['error']}")
+    return False
 
 def check_file_exists(file_path, description):
     """Check if a file exists."""
-    if Path(file_path).exists():
+    if _exists(file_path):
         print(f"✅ {description}")
         return True
     else:
@@ -68,6 +117,10 @@ def run_comprehensive_tests():
     # Test results tracking
     test_results = {}
     
+    # Run the independent test scripts concurrently up front; their results
+    # are reported in section order below.
+    script_outcomes = asyncio.run(run_test_scripts(TEST_SCRIPTS))
+    
     print_section("1. File Structure Validation")
     
     # Check critical files
@@ -89,15 +142,17 @@ def run_comprehensive_tests():
     print_section("2. Basic Project Tests")
     
     # Run basic project test
-    test_results["Basic Tests"] = run_test_script(
-        "test_basic.py", 
+    test_results["Basic Tests"] = report_test_script(
+        script_outcomes["test_basic.py"],
+        "test_basic.py",
         "Basic Project Structure Tests"
     )
     
     print_section("3. Infrastructure Tests")
     
     # Run infrastructure tests
-    test_results["Infrastructure"] = run_test_script(
+    test_results["Infrastructure"] = report_test_script(
+        script_outcomes["infrastructure/test-simple.ps1"],
         "infrastructure/test-simple.ps1",
         "Infrastructure Validation Tests"
     )
@@ -105,7 +160,8 @@ def run_comprehensive_tests():
     print_section("4. Minimal CLI Tests")
     
     # Run minimal CLI tests
-    test_results["CLI Tests"] = run_test_script(
+    test_results["CLI Tests"] = report_test_script(
+        script_outcomes["test_cli_minimal.py"],
         "test_cli_minimal.py",
         "Minimal CLI Functionality Tests"
     )
@@ -114,7 +170,8 @@ def run_comprehensive_tests():
     
     # Test configuration loading
     try:
-        sys.path.insert(0, 'src')
+        if 'src' not in sys.path:
+            sys.path.insert(0, 'src')
         from sports_prediction.config.settings import settings
         print("✅ Configuration module loads successfully")
         print(f"✅ {len(settings.supported_sports)} sports configured")
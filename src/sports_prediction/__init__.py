@@ -10,17 +10,19 @@ __email__ = "team@sportsprediction.com"
 
 from .config.settings import Settings
 
-# Conditional imports to avoid dependency issues during testing
-__all__ = ["Settings"]
+__all__ = ["Settings", "SportsPredictor", "SportsPredictionBot"]
 
-try:
-    from .prediction_engine.predictor import SportsPredictor
-    __all__.append("SportsPredictor")
-except ImportError:
-    pass
 
-try:
-    from .telegram_bot.bot import SportsPredictionBot
-    __all__.append("SportsPredictionBot")
-except ImportError:
-    pass
+def __getattr__(name):
+    """Lazily import heavy components on first access (PEP 562).
+
+    The predictor and bot pull in the ML and Telegram stacks, so importing
+    them eagerly would make every ``import sports_prediction`` pay for them.
+    """
+    if name == "SportsPredictor":
+        from .prediction_engine.predictor import SportsPredictor
+        return SportsPredictor
+    if name == "SportsPredictionBot":
+        from .telegram_bot.bot import SportsPredictionBot
+        return SportsPredictionBot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
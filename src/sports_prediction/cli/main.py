@@ -2,24 +2,96 @@
 
 import asyncio
 import click
+import os
+import signal
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from ..config.settings import settings
 from ..telegram_bot.bot import SportsPredictionBot
 from ..prediction_engine.predictor import SportsPredictor
 from ..data_collection.data_manager import DataManager
+from ..data_collection.http_client import close_session
 from ..utils.logger import get_logger
+from ..utils.loop import use_uvloop
 
 logger = get_logger(__name__)
 
+# Seconds between cycles of continuous data collection
+COLLECTION_INTERVAL = 3600
+
+
+# Predictors entered during the running command, shared by sport so each
+# one loads its models and opens its sessions only once
+_predictors: Dict[str, "asyncio.Future[SportsPredictor]"] = {}
+
+
+async def get_predictor(sport: str) -> SportsPredictor:
+    """Get the entered predictor for a sport, creating it on first use."""
+    if sport not in _predictors:
+        _predictors[sport] = asyncio.ensure_future(SportsPredictor(sport).__aenter__())
+    return await _predictors[sport]
+
+
+async def close_predictors() -> None:
+    """Exit every pooled predictor."""
+    entering = list(_predictors.values())
+    _predictors.clear()
+    
+    for future in entering:
+        if not future.done() or future.cancelled() or future.exception():
+            future.cancel()
+            continue
+        try:
+            await future.result().__aexit__(None, None, None)
+        except Exception as e:
+            logger.error(f"Error closing predictor: {e}")
+
+
+def run_with_predictors(main):
+    """Run a command coroutine, closing pooled predictors on the same event loop."""
+    async def run():
+        try:
+            return await main
+        finally:
+            await close_predictors()
+            await close_session()
+    
+    return asyncio.run(run())
+
+
+def _runtime_dirs() -> List[Path]:
+    """Directories the system reads from and writes to."""
+    return [
+        settings.data_dir,
+        settings.raw_data_dir,
+        settings.processed_data_dir,
+        settings.models_dir,
+        settings.cache_dir,
+        Path("logs")
+    ]
+
+
+def _ensure_dirs(paths: List[Path]) -> None:
+    """Create directories, including parents, that do not exist yet."""
+    for path in paths:
+        path.mkdir(parents=True, exist_ok=True)
+
+
+def _log_loop_exception(loop: asyncio.AbstractEventLoop, context: dict) -> None:
+    """Log exceptions from tasks that nothing awaited."""
+    exception = context.get('exception')
+    logger.error(f"Unhandled error in event loop: {context.get('message')}: {exception!r}")
+
 
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
     """Sports Prediction Bot CLI."""
-    pass
+    # Run every command's event loop on libuv where uvloop is available
+    use_uvloop()
 
 
 @cli.command()
@@ -43,16 +115,31 @@ def run_bot(webhook_url: Optional[str], port: int, production: bool):
             click.echo(f"❌ Error running server: {e}")
             logger.error(f"Server error: {e}")
     else:
-        # Use polling for development
+        # Use a webhook when --webhook-url is given, otherwise long polling
         async def start_bot():
+            loop = asyncio.get_running_loop()
+            loop.set_exception_handler(_log_loop_exception)
+            # Shut down cleanly when the process is asked to terminate
+            try:
+                loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+            except NotImplementedError:
+                pass  # No loop signal handlers on Windows
+            # Create runtime directories off the event loop
+            await asyncio.to_thread(_ensure_dirs, _runtime_dirs())
             bot = SportsPredictionBot()
 
             try:
                 await bot.initialize()
-                click.echo("🔄 Starting bot with polling...")
-                await bot.start_polling()
+                if webhook_url:
+                    click.echo(f"🌐 Starting bot with webhook on port {port}...")
+                    await bot.start_webhook(webhook_url, port)
+                    # Keep the bot running
+                    await asyncio.Event().wait()
+                else:
+                    click.echo("🔄 Starting bot with polling...")
+                    await bot.start_polling()
 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
                 click.echo("\n⏹️ Bot stopped by user")
             except Exception as e:
                 click.echo(f"❌ Error running bot: {e}")
@@ -78,21 +165,34 @@ def collect_data(sport: str, days: int, continuous: bool):
         async with DataManager() as data_manager:
             if continuous:
                 click.echo("🔄 Starting continuous data collection...")
-                # Implement continuous collection logic
-                while True:
+                
+                async def collect_sport(sport_name: str):
+                    click.echo(f"Collecting data for {sport_name}...")
+                    started = time.monotonic()
                     try:
-                        # Collect data for all supported sports
-                        for sport_name in settings.supported_sports:
-                            click.echo(f"Collecting data for {sport_name}...")
-                            data = await data_manager.collect_comprehensive_data(sport_name, [])
-                            click.echo(f"✅ Collected {len(data.get('teams', {}))} teams data for {sport_name}")
-                        
-                        # Wait before next collection
-                        await asyncio.sleep(3600)  # 1 hour
-                        
+                        data = await data_manager.collect_comprehensive_data(sport_name, [])
+                        click.echo(f"✅ Collected {len(data.get('teams', {}))} teams data for {sport_name}")
                     except Exception as e:
-                        logger.error(f"Error in continuous collection: {e}")
-                        await asyncio.sleep(300)  # 5 minutes on error
+                        logger.error(f"Error collecting data for {sport_name}: {e}")
+                    finally:
+                        logger.info(f"Collection for {sport_name} took {time.monotonic() - started:.1f}s")
+                
+                # Schedule cycles against fixed deadlines so collection time
+                # does not push every later cycle back
+                next_deadline = time.monotonic()
+                while True:
+                    # Collect data for all supported sports concurrently
+                    await asyncio.gather(*[collect_sport(sport_name) for sport_name in settings.supported_sports])
+                    
+                    # Wait for the next deadline, skipping any cycles an
+                    # overlong collection has already missed
+                    next_deadline += COLLECTION_INTERVAL
+                    now = time.monotonic()
+                    if next_deadline < now:
+                        missed = int((now - next_deadline) // COLLECTION_INTERVAL) + 1
+                        logger.warning(f"Collection overran its interval, skipping {missed} cycle(s)")
+                        next_deadline += missed * COLLECTION_INTERVAL
+                    await asyncio.sleep(next_deadline - now)
             else:
                 # Single collection
                 data = await data_manager.collect_comprehensive_data(sport, [])
@@ -115,31 +215,31 @@ def train_models(sport: str, start_date: str, end_date: str, schedule: bool):
     click.echo(f"🧠 Training models for {sport}...")
     
     async def train():
-        async with SportsPredictor(sport) as predictor:
-            if schedule:
-                click.echo("⏰ Starting scheduled model training...")
-                # Implement scheduled training logic
-                while True:
-                    try:
-                        click.echo(f"Training models for {sport}...")
-                        results = await predictor.train_models(start_date, end_date)
-                        click.echo(f"✅ Training completed: {results['training_samples']} samples")
-                        
-                        # Wait 24 hours before next training
-                        await asyncio.sleep(86400)
-                        
-                    except Exception as e:
-                        logger.error(f"Error in scheduled training: {e}")
-                        await asyncio.sleep(3600)  # 1 hour on error
-            else:
-                # Single training
-                results = await predictor.train_models(start_date, end_date)
-                click.echo(f"✅ Model training completed for {sport}")
-                click.echo(f"📊 Training samples: {results['training_samples']}")
-                click.echo(f"📁 Model saved to: {results['model_path']}")
+        predictor = await get_predictor(sport)
+        if schedule:
+            click.echo("⏰ Starting scheduled model training...")
+            # Implement scheduled training logic
+            while True:
+                try:
+                    click.echo(f"Training models for {sport}...")
+                    results = await predictor.train_models(start_date, end_date)
+                    click.echo(f"✅ Training completed: {results['training_samples']} samples")
+                    
+                    # Wait 24 hours before next training
+                    await asyncio.sleep(86400)
+                    
+                except Exception as e:
+                    logger.error(f"Error in scheduled training: {e}")
+                    await asyncio.sleep(3600)  # 1 hour on error
+        else:
+            # Single training
+            results = await predictor.train_models(start_date, end_date)
+            click.echo(f"✅ Model training completed for {sport}")
+            click.echo(f"📊 Training samples: {results['training_samples']}")
+            click.echo(f"📁 Model saved to: {results['model_path']}")
     
     try:
-        asyncio.run(train())
+        run_with_predictors(train())
     except KeyboardInterrupt:
         click.echo("\n⏹️ Model training stopped")
 
@@ -154,36 +254,36 @@ def predict(sport: str, home_team: str, away_team: str, date: Optional[str]):
     click.echo(f"🔮 Predicting {home_team} vs {away_team} ({sport})...")
     
     async def make_prediction():
-        async with SportsPredictor(sport) as predictor:
-            try:
-                prediction = await predictor.predict_match(home_team, away_team, date)
-                
-                # Display prediction results
-                final_rec = prediction.get('final_recommendation', {})
-                probabilities = final_rec.get('probabilities', {})
-                confidence = final_rec.get('confidence', 0)
-                recommendation = final_rec.get('recommendation', 'unknown')
-                
-                click.echo("\n🎯 PREDICTION RESULTS:")
-                click.echo(f"Recommendation: {recommendation}")
-                click.echo(f"Confidence: {confidence:.2f}")
-                click.echo("\n📊 PROBABILITIES:")
-                click.echo(f"Home Win: {probabilities.get('home_win', 0):.1%}")
-                click.echo(f"Draw: {probabilities.get('draw', 0):.1%}")
-                click.echo(f"Away Win: {probabilities.get('away_win', 0):.1%}")
-                
-                key_factors = final_rec.get('key_factors', [])
-                if key_factors:
-                    click.echo("\n📈 KEY FACTORS:")
-                    for i, factor in enumerate(key_factors, 1):
-                        click.echo(f"{i}. {factor}")
-                
-            except Exception as e:
-                click.echo(f"❌ Prediction failed: {e}")
-                logger.error(f"Prediction error: {e}")
+        predictor = await get_predictor(sport)
+        try:
+            prediction = await predictor.predict_match(home_team, away_team, date)
+            
+            # Display prediction results
+            final_rec = prediction.get('final_recommendation', {})
+            probabilities = final_rec.get('probabilities', {})
+            confidence = final_rec.get('confidence', 0)
+            recommendation = final_rec.get('recommendation', 'unknown')
+            
+            click.echo("\n🎯 PREDICTION RESULTS:")
+            click.echo(f"Recommendation: {recommendation}")
+            click.echo(f"Confidence: {confidence:.2f}")
+            click.echo("\n📊 PROBABILITIES:")
+            click.echo(f"Home Win: {probabilities.get('home_win', 0):.1%}")
+            click.echo(f"Draw: {probabilities.get('draw', 0):.1%}")
+            click.echo(f"Away Win: {probabilities.get('away_win', 0):.1%}")
+            
+            key_factors = final_rec.get('key_factors', [])
+            if key_factors:
+                click.echo("\n📈 KEY FACTORS:")
+                for i, factor in enumerate(key_factors, 1):
+                    click.echo(f"{i}. {factor}")
+            
+        except Exception as e:
+            click.echo(f"❌ Prediction failed: {e}")
+            logger.error(f"Prediction error: {e}")
     
     try:
-        asyncio.run(make_prediction())
+        run_with_predictors(make_prediction())
     except KeyboardInterrupt:
         click.echo("\n⏹️ Prediction cancelled")
 
@@ -195,31 +295,39 @@ def upcoming(sport: Optional[str], days: int):
     """Show upcoming matches."""
     sports_to_check = [sport] if sport else settings.supported_sports
     
+    async def fetch_upcoming(sport_name: str):
+        try:
+            predictor = await get_predictor(sport_name)
+            return sport_name, await predictor.predict_upcoming_matches(days), None
+        except Exception as e:
+            return sport_name, None, e
+    
     async def show_upcoming():
-        for sport_name in sports_to_check:
+        # Fetch all sports concurrently, showing each as soon as it is ready
+        tasks = [asyncio.create_task(fetch_upcoming(sport_name)) for sport_name in sports_to_check]
+        
+        for next_done in asyncio.as_completed(tasks):
+            sport_name, matches, error = await next_done
             click.echo(f"\n🏆 {sport_name.upper()} - Upcoming Matches:")
             
-            async with SportsPredictor(sport_name) as predictor:
-                try:
-                    matches = await predictor.predict_upcoming_matches(days)
-                    
-                    if not matches:
-                        click.echo("📅 No upcoming matches found")
-                        continue
-                    
-                    for i, match in enumerate(matches[:10], 1):
-                        match_info = match.get('match_info', {})
-                        home_team = match_info.get('home_team_name', 'Home')
-                        away_team = match_info.get('away_team_name', 'Away')
-                        match_date = match_info.get('match_date', 'TBD')
-                        
-                        click.echo(f"{i}. {home_team} vs {away_team} - {match_date}")
+            if error is not None:
+                click.echo(f"❌ Error fetching matches for {sport_name}: {error}")
+                continue
+            
+            if not matches:
+                click.echo("📅 No upcoming matches found")
+                continue
+            
+            for i, match in enumerate(matches[:10], 1):
+                match_info = match.get('match_info', {})
+                home_team = match_info.get('home_team_name', 'Home')
+                away_team = match_info.get('away_team_name', 'Away')
+                match_date = match_info.get('match_date', 'TBD')
                 
-                except Exception as e:
-                    click.echo(f"❌ Error fetching matches for {sport_name}: {e}")
+                click.echo(f"{i}. {home_team} vs {away_team} - {match_date}")
     
     try:
-        asyncio.run(show_upcoming())
+        run_with_predictors(show_upcoming())
     except KeyboardInterrupt:
         click.echo("\n⏹️ Cancelled")
 
@@ -230,17 +338,10 @@ def setup():
     click.echo("🔧 Setting up Sports Prediction System...")
     
     # Create necessary directories
-    directories = [
-        settings.data_dir,
-        settings.raw_data_dir,
-        settings.processed_data_dir,
-        settings.models_dir,
-        settings.cache_dir,
-        Path("logs")
-    ]
+    directories = _runtime_dirs()
+    _ensure_dirs(directories)
     
     for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
         click.echo(f"📁 Created directory: {directory}")
     
     # Check configuration
@@ -322,10 +423,18 @@ def status():
     
     # Check model files
     click.echo("\n🧠 Trained Models:")
-    model_files = list(settings.models_dir.glob("*.joblib"))
+    try:
+        with os.scandir(settings.models_dir) as entries:
+            model_files = [
+                entry.name for entry in entries
+                if entry.name.endswith(".joblib") and entry.is_file(follow_symlinks=False)
+            ]
+    except OSError:
+        model_files = []
+    
     if model_files:
         for model_file in model_files:
-            click.echo(f"  ✅ {model_file.name}")
+            click.echo(f"  ✅ {model_file}")
     else:
         click.echo("  ❌ No trained models found")
 
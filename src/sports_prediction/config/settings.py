@@ -1,7 +1,8 @@
 """Configuration settings for the sports prediction system."""
 
 import os
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, FrozenSet, Optional, Tuple
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from pathlib import Path
@@ -13,6 +14,7 @@ class Settings(BaseSettings):
     # Telegram Bot Configuration
     telegram_bot_token: Optional[str] = Field(None, env="TELEGRAM_BOT_TOKEN")
     telegram_webhook_url: Optional[str] = Field(None, env="TELEGRAM_WEBHOOK_URL")
+    bot_concurrent_updates: int = Field(64, env="BOT_CONCURRENT_UPDATES")
     
     # Sports Data APIs
     espn_api_key: Optional[str] = Field(None, env="ESPN_API_KEY")
@@ -46,36 +48,43 @@ class Settings(BaseSettings):
     # Rate Limiting
     api_rate_limit: int = Field(100, env="API_RATE_LIMIT")
     scraper_delay: int = Field(2, env="SCRAPER_DELAY")
+    collector_concurrency: int = Field(32, env="COLLECTOR_CONCURRENCY")
+    request_budget_seconds: int = Field(60, env="REQUEST_BUDGET_SECONDS")
     
     # Development
     debug: bool = Field(False, env="DEBUG")
     testing: bool = Field(False, env="TESTING")
     
     # Supported Sports
-    supported_sports: List[str] = [
+    supported_sports: Tuple[str, ...] = (
         "mls", "nba", "nfl", "nhl", "mlb", 
         "premier_league", "champions_league", "la_liga", "bundesliga", "serie_a",
         "ufc", "boxing", "tennis", "rugby"
-    ]
+    )
+    
+    @cached_property
+    def supported_sports_set(self) -> FrozenSet[str]:
+        """Lower-cased supported sports for membership checks on user input."""
+        return frozenset(sport.lower() for sport in self.supported_sports)
     
     # Model Paths
-    @property
+    @cached_property
     def models_dir(self) -> Path:
         return Path("models")
     
-    @property
+    @cached_property
     def data_dir(self) -> Path:
         return Path("data")
     
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         return self.data_dir / "cache"
     
-    @property
+    @cached_property
     def raw_data_dir(self) -> Path:
         return self.data_dir / "raw"
     
-    @property
+    @cached_property
     def processed_data_dir(self) -> Path:
         return self.data_dir / "processed"
     
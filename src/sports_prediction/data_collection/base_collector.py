@@ -1,39 +1,78 @@
 """Base class for data collectors."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional
 from datetime import datetime, timedelta
 import asyncio
+import random
+import sys
 import aiohttp
-from ..utils.cache import CacheManager
+import orjson
+from .http_client import acquire_session, release_session
+from ..utils.cache import TwoTierCache
 from ..utils.rate_limiter import RateLimiter
 from ..utils.logger import get_logger
 from ..config.settings import settings
 
 logger = get_logger(__name__)
 
+# Responses worth retrying: rate limited or temporarily unavailable
+RETRY_STATUSES = (429, 503)
+# Transport failures worth retrying
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+
+# Seconds responses are cached, by the kind passed to get_cache_key; live
+# data goes stale in seconds while season stats hold for hours. Other kinds
+# use settings.cache_ttl. The local cache tier never serves a copy longer
+# than the backing entry has left, whether it was written or read through.
+CACHE_TTLS = {
+    'live_odds': 5,
+    'upcoming_odds': 60,
+    'upcoming_matches': 300,
+    'recent_matches': 900,
+    'team_stats': 21600,
+    'player_stats': 21600,
+    'match_history': 86400,
+}
+# Seconds a response's validators and body are kept after it goes stale, so
+# the next fetch can revalidate it with a conditional GET
+REVALIDATE_TTL = 86400
+
 
 class BaseDataCollector(ABC):
     """Base class for all data collectors."""
     
-    def __init__(self, name: str):
+    # Requests currently on the wire, keyed by cache key, shared by all
+    # collectors so concurrent callers for the same data await one response
+    _inflight: Dict[str, asyncio.Future] = {}
+    
+    def __init__(self, name: str, max_concurrent_requests: int = 10):
         self.name = name
-        self.cache = CacheManager()
+        self._key_prefix = sys.intern(f"{name}:")
+        self.cache = TwoTierCache()
         self.rate_limiter = RateLimiter()
         self.session: Optional[aiohttp.ClientSession] = None
+        self.max_retries = 3
+        self.base_delay = 1.0
+        # Requests to this collector's API on the wire at once
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+        # Sports this collector has data for; None means every sport
+        self.supported_sports: Optional[FrozenSet[str]] = None
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'Sports-Prediction-Bot/1.0'}
-        )
+        self.session = await acquire_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self.session:
-            await self.session.close()
+            self.session = None
+            await release_session()
+    
+    def supports(self, sport: str) -> bool:
+        """Check whether this collector has data for a sport."""
+        return self.supported_sports is None or sport in self.supported_sports
     
     @abstractmethod
     async def get_team_stats(self, sport: str, team_id: str, season: str) -> Dict[str, Any]:
@@ -62,42 +101,168 @@ class BaseDataCollector(ABC):
     
     async def make_request(self, url: str, params: Optional[Dict] = None, cache_key: Optional[str] = None) -> Optional[Dict]:
         """Make HTTP request with caching and rate limiting."""
+        if not cache_key:
+            return await self._fetch_within_budget(url, params, cache_key)
         
         # Check cache first
-        if cache_key:
-            cached_data = self.cache.get(cache_key)
-            if cached_data:
-                logger.debug(f"Cache hit for {cache_key}")
-                return cached_data
+        cached_data = self.cache.get(cache_key)
+        if cached_data:
+            logger.debug(f"Cache hit for {cache_key}")
+            return cached_data
         
-        # Rate limiting
-        self.rate_limiter.wait_if_needed(self.name)
+        # Coalesce duplicate concurrent requests into a single fetch
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            logger.debug(f"Joining in-flight request for {cache_key}")
+            # wait() raises CancelledError only when this caller is cancelled,
+            # and never cancels the shared request on its way out
+            await asyncio.wait((inflight,))
+            if inflight.cancelled():
+                # The fetching caller was cancelled, not this one; fetch again
+                return await self.make_request(url, params, cache_key)
+            return inflight.result()
         
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
         try:
-            if not self.session:
-                raise RuntimeError("Session not initialized. Use async context manager.")
+            data = await self._fetch_within_budget(url, params, cache_key)
+            future.set_result(data)
+            return data
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # Joined callers re-raise the same error; mark it retrieved so a
+            # future nobody joined is not logged as a lost exception
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del self._inflight[cache_key]
+    
+    async def _fetch_within_budget(self, url: str, params: Optional[Dict], cache_key: Optional[str]) -> Optional[Dict]:
+        """Fetch a URL, giving up once the wall-clock request budget is spent."""
+        try:
+            return await asyncio.wait_for(self._fetch(url, params, cache_key), settings.request_budget_seconds)
+        except asyncio.TimeoutError:
+            logger.error(f"Request budget of {settings.request_budget_seconds}s exhausted for {url}")
+            return None
+    
+    async def _fetch(self, url: str, params: Optional[Dict], cache_key: Optional[str]) -> Optional[Dict]:
+        """Fetch a URL with rate limiting and retries, caching a successful result."""
+        if not self.session:
+            logger.error(f"Request failed for {url}: Session not initialized. Use async context manager.")
+            return None
+        
+        # A stale copy lets the server answer 304 instead of resending the body
+        stale = self.cache.get(f"{cache_key}:revalidate") if cache_key else None
+        headers = self._conditional_headers(stale) if stale else None
+        
+        for attempt in range(self.max_retries + 1):
+            # Rate limiting
+            await self.rate_limiter.acquire(self.name)
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
+            retry_after = None
+            try:
+                async with self._request_slots, self.session.get(url, params=params, headers=headers) as response:
+                    self.rate_limiter.update_from_headers(self.name, response.headers)
                     
-                    # Cache the result
-                    if cache_key:
-                        self.cache.set(cache_key, data)
-                        logger.debug(f"Cached data for {cache_key}")
+                    if response.status == 304 and stale:
+                        logger.debug(f"Revalidated cached data for {cache_key}")
+                        self.cache.set(cache_key, stale['data'], ttl=self._cache_ttl(cache_key))
+                        return stale['data']
                     
-                    return data
-                else:
-                    logger.error(f"HTTP {response.status} for {url}")
-                    return None
+                    if response.status == 200:
+                        # Parse the raw bytes; response.json() would first decode them to str
+                        data = orjson.loads(await response.read())
+                        
+                        # Cache the result
+                        if cache_key:
+                            self.cache.set(cache_key, data, ttl=self._cache_ttl(cache_key))
+                            self._store_validators(cache_key, response.headers, data)
+                            logger.debug(f"Cached data for {cache_key}")
+                        
+                        return data
+                    
+                    if response.status not in RETRY_STATUSES:
+                        logger.error(f"HTTP {response.status} for {url}")
+                        return None
+                    
+                    logger.warning(f"HTTP {response.status} for {url} (attempt {attempt + 1})")
+                    retry_after = response.headers.get('Retry-After')
+            
+            except RETRY_EXCEPTIONS as e:
+                logger.warning(f"Request failed for {url} (attempt {attempt + 1}): {e}")
+            except Exception as e:
+                logger.error(f"Request failed for {url}: {e}")
+                return None
+            
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
         
-        except Exception as e:
-            logger.error(f"Request failed for {url}: {e}")
-            return None
+        logger.error(f"Giving up on {url} after {self.max_retries + 1} attempts")
+        return None
+    
+    @staticmethod
+    def _conditional_headers(stale: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """Build conditional GET headers from a stale response's validators."""
+        headers = {}
+        if stale.get('etag'):
+            headers['If-None-Match'] = stale['etag']
+        if stale.get('last_modified'):
+            headers['If-Modified-Since'] = stale['last_modified']
+        return headers or None
+    
+    def _store_validators(self, cache_key: str, response_headers: Any, data: Any) -> None:
+        """Keep a response's validators and body for later revalidation."""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified:
+            self.cache.set(
+                f"{cache_key}:revalidate",
+                {'etag': etag, 'last_modified': last_modified, 'data': data},
+                ttl=REVALIDATE_TTL
+            )
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Get the jittered delay before the next attempt, honouring Retry-After."""
+        if retry_after is not None:
+            try:
+                return float(retry_after) + random.random()
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        return self.base_delay * 2 ** attempt + random.random()
+    
+    async def get_many_team_stats(self, sport: str, team_ids: List[str], season: str) -> List[Any]:
+        """Get statistics for many teams concurrently.
+        
+        Results follow the order of team_ids; a team whose lookup raised gets
+        the exception in its place.
+        """
+        return await self._gather_bounded([self.get_team_stats(sport, team_id, season) for team_id in team_ids])
+    
+    async def get_many_recent_matches(self, sport: str, team_ids: List[str], limit: int = 10) -> List[Any]:
+        """Get recent matches for many teams concurrently, like get_many_team_stats."""
+        return await self._gather_bounded([self.get_recent_matches(sport, team_id, limit) for team_id in team_ids])
+    
+    async def _gather_bounded(self, coros: List[Any]) -> List[Any]:
+        """Run coroutines concurrently, bounded so large batches do not flood the connection pool."""
+        semaphore = asyncio.Semaphore(settings.collector_concurrency)
+        
+        async def run(coro):
+            async with semaphore:
+                return await coro
+        
+        return await asyncio.gather(*[run(coro) for coro in coros], return_exceptions=True)
     
     def get_cache_key(self, *args) -> str:
         """Generate cache key from arguments."""
-        return f"{self.name}:" + ":".join(str(arg) for arg in args)
+        return self._key_prefix + ":".join(map(str, args))
+    
+    def _cache_ttl(self, cache_key: str) -> Optional[int]:
+        """Get the cache TTL for a key from the kind it was generated with."""
+        kind = cache_key[len(self._key_prefix):].split(":", 1)[0]
+        return CACHE_TTLS.get(kind)
     
     async def collect_all_data(self, sport: str, team_ids: List[str]) -> Dict[str, Any]:
         """Collect all available data for given teams."""
@@ -108,29 +273,67 @@ class BaseDataCollector(ABC):
             'updated_at': datetime.now().isoformat()
         }
         
-        # Collect team data
-        for team_id in team_ids:
-            try:
-                team_stats = await self.get_team_stats(sport, team_id, "2024")
-                if team_stats:
-                    data['teams'][team_id] = team_stats
-                
-                recent_matches = await self.get_recent_matches(sport, team_id)
-                if recent_matches:
-                    data['matches'].extend(recent_matches)
-                
-                # Add delay between teams
-                self.rate_limiter.add_delay(self.name)
-                
-            except Exception as e:
-                logger.error(f"Error collecting data for team {team_id}: {e}")
+        # Matches keyed by identity; teams that played each other both
+        # report the same match
+        matches: Dict[Any, Dict[str, Any]] = {}
+        
+        season = "2024"
+        recent_limit = 10
+        
+        # Upcoming matches do not depend on any team, so fetch them while the
+        # team data is collected
+        upcoming_task = asyncio.create_task(self.get_upcoming_matches(sport))
+        
+        try:
+            # Fetch every cached team entry in one round trip, off the event
+            # loop; hits land in the local cache tier, so the per-team
+            # lookups below skip Redis
+            await asyncio.to_thread(
+                self.cache.mget,
+                [self.get_cache_key("team_stats", sport, team_id, season) for team_id in team_ids]
+                + [self.get_cache_key("recent_matches", sport, team_id, recent_limit) for team_id in team_ids]
+            )
+            
+            all_team_stats, all_recent_matches = await asyncio.gather(
+                self.get_many_team_stats(sport, team_ids, season),
+                self.get_many_recent_matches(sport, team_ids, recent_limit)
+            )
+        except BaseException:
+            upcoming_task.cancel()
+            raise
+        
+        for team_id, team_stats, recent_matches in zip(team_ids, all_team_stats, all_recent_matches):
+            if isinstance(team_stats, Exception):
+                logger.error(f"Error collecting stats for team {team_id}: {team_stats}")
+            elif team_stats:
+                data['teams'][team_id] = team_stats
+            
+            if isinstance(recent_matches, Exception):
+                logger.error(f"Error collecting recent matches for team {team_id}: {recent_matches}")
+            elif recent_matches:
+                for match in recent_matches:
+                    matches.setdefault(self._match_key(match), match)
         
         # Get upcoming matches
         try:
-            upcoming = await self.get_upcoming_matches(sport)
+            upcoming = await upcoming_task
             if upcoming:
-                data['matches'].extend(upcoming)
+                for match in upcoming:
+                    matches.setdefault(self._match_key(match), match)
         except Exception as e:
             logger.error(f"Error collecting upcoming matches: {e}")
         
+        data['matches'] = list(matches.values())
         return data
+    
+    @staticmethod
+    def _match_key(match: Dict[str, Any]) -> Any:
+        """Identify a match by its id, or by teams and date when it has none."""
+        match_id = match.get('id')
+        if match_id is not None:
+            return match_id
+        return (
+            (match.get('home_team') or {}).get('id'),
+            (match.get('away_team') or {}).get('id'),
+            match.get('date')
+        )
@@ -3,26 +3,48 @@
 import asyncio
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
+import orjson
 import pandas as pd
 from pathlib import Path
 from .espn_collector import ESPNCollector
 from .sportradar_collector import SportRadarCollector
 from .odds_collector import OddsCollector
 from .web_scraper import WebScraper
+from .http_client import warm_up
 from ..utils.cache import CacheManager
 from ..utils.logger import get_logger
 from ..config.settings import settings
 
 logger = get_logger(__name__)
 
+# Match statuses (ESPN and SportRadar) under which scores and records change
+LIVE_MATCH_STATUSES = frozenset({
+    'STATUS_IN_PROGRESS', 'STATUS_HALFTIME', 'STATUS_END_PERIOD',
+    'inprogress', 'halftime', 'live'
+})
+
 
 class DataManager:
     """Manages data collection from multiple sources."""
     
+    # Web scraping sources for each sport
+    SCRAPE_SOURCES = {
+        'mls': ('transfermarkt', 'fbref'),
+        'premier_league': ('transfermarkt', 'fbref'),
+        'la_liga': ('transfermarkt', 'fbref'),
+        'bundesliga': ('transfermarkt', 'fbref'),
+        'serie_a': ('transfermarkt', 'fbref'),
+        'champions_league': ('transfermarkt', 'fbref'),
+        'nba': ('basketball_reference',),
+        'nfl': ('pro_football_reference',),
+        'nhl': ('hockey_reference',),
+    }
+    
     def __init__(self):
         self.cache = CacheManager()
         self.collectors = {}
         self.scraper = None
+        self._warm_up_task: Optional[asyncio.Task] = None
         
         # Initialize collectors
         self.collectors['espn'] = ESPNCollector()
@@ -39,10 +61,23 @@ class DataManager:
         self.scraper = WebScraper()
         await self.scraper.__aenter__()
         
+        # Connect to every API that has data to serve in the background, so a
+        # slow or unreachable origin does not hold up entry
+        self._warm_up_task = asyncio.create_task(warm_up([
+            collector.base_url for collector in self.collectors.values()
+            if collector.supported_sports is None or collector.supported_sports
+        ]))
+        
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        # Stop any warm-up still running before its session is released
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            await asyncio.gather(self._warm_up_task, return_exceptions=True)
+            self._warm_up_task = None
+        
         # Close all collectors
         for collector in self.collectors.values():
             await collector.__aexit__(exc_type, exc_val, exc_tb)
@@ -55,50 +90,50 @@ class DataManager:
         """Collect comprehensive data from all sources."""
         logger.info(f"Starting comprehensive data collection for {sport}")
         
+        # One timestamp for the whole batch, shared by the merge and the save
+        now = datetime.now()
+        
         # Collect data from all sources concurrently
-        tasks = []
+        sources = []
+        coros = []
         
-        # API collectors
+        # API collectors, skipping any without data for this sport
         for source_name, collector in self.collectors.items():
-            if source_name != 'odds':  # Odds collector doesn't provide team stats
-                task = asyncio.create_task(
-                    collector.collect_all_data(sport, team_ids),
-                    name=f"{source_name}_collection"
-                )
-                tasks.append((source_name, task))
+            if source_name != 'odds' and collector.supports(sport):  # Odds collector doesn't provide team stats
+                sources.append(source_name)
+                coros.append(collector.collect_all_data(sport, team_ids))
         
         # Odds data
-        odds_task = asyncio.create_task(
-            self.collectors['odds'].get_upcoming_matches(sport),
-            name="odds_collection"
-        )
-        tasks.append(('odds', odds_task))
+        if self.collectors['odds'].supports(sport):
+            sources.append('odds')
+            coros.append(self.collectors['odds'].get_upcoming_matches(sport))
         
         # Web scraping tasks
         if self.scraper:
             for team_id in team_ids[:3]:  # Limit scraping to avoid rate limits
-                scrape_task = asyncio.create_task(
-                    self._scrape_team_data(sport, team_id),
-                    name=f"scrape_{team_id}"
-                )
-                tasks.append((f'scrape_{team_id}', scrape_task))
+                sources.append(f'scrape_{team_id}')
+                coros.append(self._scrape_team_data(sport, team_id))
         
-        # Wait for all tasks to complete
+        # Wait for all sources to complete
         results = {}
-        for source_name, task in tasks:
-            try:
-                result = await task
+        for source_name, result in zip(sources, await asyncio.gather(*coros, return_exceptions=True)):
+            if isinstance(result, Exception):
+                logger.error(f"Error collecting data from {source_name}: {result}")
+                results[source_name] = {}
+            else:
                 results[source_name] = result
                 logger.info(f"Completed data collection from {source_name}")
-            except Exception as e:
-                logger.error(f"Error collecting data from {source_name}: {e}")
-                results[source_name] = {}
         
         # Merge and process results
-        merged_data = self._merge_data_sources(results, sport)
+        merged_data = self._merge_data_sources(results, sport, now)
+        
+        # Drop cached analyses for teams playing right now; their records and
+        # recent results are changing
+        for team_id in self._live_team_ids(merged_data['matches']):
+            self.cache.invalidate_tag(f"team:{sport}:{team_id}")
         
         # Save to cache and file
-        await self._save_data(merged_data, sport)
+        await self._save_data(merged_data, sport, now)
         
         logger.info(f"Comprehensive data collection completed for {sport}")
         return merged_data
@@ -110,52 +145,41 @@ class DataManager:
         if cached_data:
             return cached_data
         
-        # Collect team data from multiple sources
-        tasks = []
+        # Sources without data for this sport keep empty results
+        team_stats = {source_name: {} for source_name in self.collectors if source_name != 'odds'}
+        recent_matches = {source_name: [] for source_name in team_stats}
         
-        for source_name, collector in self.collectors.items():
-            if source_name != 'odds':
-                task = asyncio.create_task(
-                    collector.get_team_stats(sport, team_id, "2024")
-                )
-                tasks.append((source_name, task))
-        
-        # Recent matches
-        recent_matches_tasks = []
-        for source_name, collector in self.collectors.items():
-            if source_name != 'odds':
-                task = asyncio.create_task(
-                    collector.get_recent_matches(sport, team_id, 10)
-                )
-                recent_matches_tasks.append((source_name, task))
-        
-        # Execute all tasks
-        team_stats = {}
-        recent_matches = {}
-        
-        for source_name, task in tasks:
-            try:
-                result = await task
+        # Collect team stats, recent matches and scraped data in one round
+        api_sources = [source_name for source_name in team_stats if self.collectors[source_name].supports(sport)]
+        coros = [self.collectors[source_name].get_team_stats(sport, team_id, "2024") for source_name in api_sources]
+        coros += [self.collectors[source_name].get_recent_matches(sport, team_id, 10) for source_name in api_sources]
+        if self.scraper:
+            coros.append(self._scrape_team_data(sport, team_id))
+        
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        stats_results = results[:len(api_sources)]
+        recent_results = results[len(api_sources):2 * len(api_sources)]
+        
+        for source_name, result in zip(api_sources, stats_results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting team stats from {source_name}: {result}")
+            else:
                 team_stats[source_name] = result
-            except Exception as e:
-                logger.error(f"Error getting team stats from {source_name}: {e}")
-                team_stats[source_name] = {}
         
-        for source_name, task in recent_matches_tasks:
-            try:
-                result = await task
+        for source_name, result in zip(api_sources, recent_results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting recent matches from {source_name}: {result}")
+            else:
                 recent_matches[source_name] = result
-            except Exception as e:
-                logger.error(f"Error getting recent matches from {source_name}: {e}")
-                recent_matches[source_name] = []
         
         # Web scraping data
         scraped_data = {}
         if self.scraper:
-            try:
-                scraped_data = await self._scrape_team_data(sport, team_id)
-            except Exception as e:
-                logger.error(f"Error scraping team data: {e}")
+            scraped = results[-1]
+            if isinstance(scraped, Exception):
+                logger.error(f"Error scraping team data: {scraped}")
+            else:
+                scraped_data = scraped
         
         # Merge all data
         analysis = {
@@ -168,7 +192,8 @@ class DataManager:
         }
         
         # Cache the result
-        self.cache.set(cache_key, analysis, ttl=1800)  # 30 minutes
+        self.cache.set(cache_key, analysis, ttl=1800,  # 30 minutes
+                       tags=[f"team:{sport}:{team_id}", f"sport:{sport}"])
         
         return analysis
     
@@ -176,53 +201,38 @@ class DataManager:
         """Get all data needed for match prediction."""
         logger.info(f"Collecting prediction data for {home_team_id} vs {away_team_id}")
         
-        # Get team analyses
-        home_analysis_task = asyncio.create_task(
-            self.get_team_analysis(sport, home_team_id)
-        )
-        away_analysis_task = asyncio.create_task(
-            self.get_team_analysis(sport, away_team_id)
-        )
+        h2h_history = {source_name: [] for source_name in self.collectors if source_name != 'odds'}
+        h2h_sources = [source_name for source_name in h2h_history if self.collectors[source_name].supports(sport)]
         
-        # Get head-to-head history
-        h2h_tasks = []
-        for source_name, collector in self.collectors.items():
-            if source_name != 'odds':
-                task = asyncio.create_task(
-                    collector.get_match_history(sport, home_team_id, away_team_id, 10)
-                )
-                h2h_tasks.append((source_name, task))
-        
-        # Get odds data
-        odds_task = asyncio.create_task(
-            self.collectors['odds'].get_upcoming_matches(sport)
+        # Get team analyses and head-to-head history concurrently
+        home_analysis, away_analysis, *h2h_results = await asyncio.gather(
+            self.get_team_analysis(sport, home_team_id),
+            self.get_team_analysis(sport, away_team_id),
+            *[self.collectors[source_name].get_match_history(sport, home_team_id, away_team_id, 10)
+              for source_name in h2h_sources],
+            return_exceptions=True
         )
         
-        # Wait for all tasks
-        home_analysis = await home_analysis_task
-        away_analysis = await away_analysis_task
+        for analysis in (home_analysis, away_analysis):
+            if isinstance(analysis, Exception):
+                raise analysis
         
-        h2h_history = {}
-        for source_name, task in h2h_tasks:
-            try:
-                result = await task
+        for source_name, result in zip(h2h_sources, h2h_results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting H2H history from {source_name}: {result}")
+            else:
                 h2h_history[source_name] = result
-            except Exception as e:
-                logger.error(f"Error getting H2H history from {source_name}: {e}")
-                h2h_history[source_name] = []
         
+        match_odds = None
         try:
-            odds_data = await odds_task
-            # Find odds for this specific match
-            match_odds = None
-            for match in odds_data:
-                if ((match.get('home_team') == home_team_id or match.get('home_team') in home_analysis.get('team_stats', {}).get('espn', {}).get('name', '')) and
-                    (match.get('away_team') == away_team_id or match.get('away_team') in away_analysis.get('team_stats', {}).get('espn', {}).get('name', ''))):
-                    match_odds = match
-                    break
+            # Odds are matched by team name, so look them up once the names are known
+            match_odds = await self.collectors['odds'].get_match_odds(
+                sport, home_team_id, away_team_id,
+                home_analysis.get('team_stats', {}).get('espn', {}).get('name', ''),
+                away_analysis.get('team_stats', {}).get('espn', {}).get('name', '')
+            )
         except Exception as e:
             logger.error(f"Error getting odds data: {e}")
-            match_odds = None
         
         return {
             'home_team': home_analysis,
@@ -233,36 +243,44 @@ class DataManager:
             'updated_at': datetime.now().isoformat()
         }
     
+    @staticmethod
+    def _live_team_ids(matches: List[Dict[str, Any]]) -> set:
+        """Get the ids of teams in matches that are currently being played."""
+        team_ids = set()
+        for match in matches:
+            if match.get('status') in LIVE_MATCH_STATUSES:
+                for side in ('home_team', 'away_team'):
+                    team_id = (match.get(side) or {}).get('id')
+                    if team_id is not None:
+                        team_ids.add(team_id)
+        return team_ids
+    
     async def _scrape_team_data(self, sport: str, team_id: str) -> Dict[str, Any]:
         """Scrape additional team data from web sources."""
         if not self.scraper:
             return {}
         
-        scraped_data = {}
+        sources = self.SCRAPE_SOURCES.get(sport, ())
         
-        # Determine appropriate scraping sources based on sport
-        sources = []
-        if sport in ['mls', 'premier_league', 'la_liga', 'bundesliga', 'serie_a', 'champions_league']:
-            sources = ['transfermarkt', 'fbref']
-        elif sport == 'nba':
-            sources = ['basketball_reference']
-        elif sport == 'nfl':
-            sources = ['pro_football_reference']
-        elif sport == 'nhl':
-            sources = ['hockey_reference']
-        
-        for source in sources:
-            try:
-                data = await self.scraper.scrape_team_data(source, sport, team_id)
-                if data:
-                    scraped_data[source] = data
-            except Exception as e:
-                logger.error(f"Error scraping from {source}: {e}")
+        # Each source is a different site, so scrape them all at once
+        results = await asyncio.gather(
+            *[self.scraper.scrape_team_data(source, sport, team_id) for source in sources],
+            return_exceptions=True
+        )
+        
+        scraped_data = {}
+        for source, data in zip(sources, results):
+            if isinstance(data, Exception):
+                logger.error(f"Error scraping from {source}: {data}")
+            elif data:
+                scraped_data[source] = data
         
         return scraped_data
     
-    def _merge_data_sources(self, results: Dict[str, Any], sport: str) -> Dict[str, Any]:
+    def _merge_data_sources(self, results: Dict[str, Any], sport: str,
+                            now: Optional[datetime] = None) -> Dict[str, Any]:
         """Merge data from multiple sources."""
+        now = now or datetime.now()
         merged = {
             'sport': sport,
             'sources': list(results.keys()),
@@ -270,45 +288,35 @@ class DataManager:
             'matches': [],
             'odds': [],
             'scraped_data': {},
-            'updated_at': datetime.now().isoformat()
+            'updated_at': now.isoformat()
         }
         
-        # Merge team data
-        for source, data in results.items():
-            if isinstance(data, dict) and 'teams' in data:
-                for team_id, team_data in data['teams'].items():
-                    if team_id not in merged['teams']:
-                        merged['teams'][team_id] = {}
-                    merged['teams'][team_id][source] = team_data
-        
-        # Merge match data
-        for source, data in results.items():
-            if isinstance(data, dict) and 'matches' in data:
-                for match in data['matches']:
-                    match['source'] = source
-                    merged['matches'].append(match)
-            elif isinstance(data, list) and source == 'odds':
-                merged['odds'] = data
+        teams = merged['teams']
+        matches = merged['matches']
         
-        # Merge scraped data
+        # Merge team, match, odds and scraped data in a single pass
         for source, data in results.items():
             if source.startswith('scrape_'):
                 merged['scraped_data'][source] = data
+            elif isinstance(data, dict):
+                for team_id, team_data in data.get('teams', {}).items():
+                    teams.setdefault(team_id, {})[source] = team_data
+                matches.extend({**match, 'source': source} for match in data.get('matches', ()))
+            elif isinstance(data, list) and source == 'odds':
+                merged['odds'] = data
         
         return merged
     
-    async def _save_data(self, data: Dict[str, Any], sport: str) -> None:
+    async def _save_data(self, data: Dict[str, Any], sport: str, now: Optional[datetime] = None) -> None:
         """Save collected data to file and cache."""
         # Save to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
         filename = f"{sport}_data_{timestamp}.json"
         filepath = settings.raw_data_dir / filename
         
         try:
-            import json
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Serialize and write off the event loop so other collection continues
+            await asyncio.to_thread(self._write_json, filepath, data)
             logger.info(f"Data saved to {filepath}")
         except Exception as e:
             logger.error(f"Error saving data to file: {e}")
@@ -316,3 +324,14 @@ class DataManager:
         # Save to cache
         cache_key = f"comprehensive_data:{sport}"
         self.cache.set(cache_key, data, ttl=3600)  # 1 hour
+    
+    @staticmethod
+    def _write_json(filepath: Path, data: Dict[str, Any]) -> None:
+        """Write data to a JSON file, creating its directory if needed."""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_bytes(orjson.dumps(
+            data,
+            default=str,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+                    | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        ))
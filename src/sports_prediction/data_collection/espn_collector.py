@@ -31,20 +31,23 @@ class ESPNCollector(BaseDataCollector):
             'serie_a': 'soccer/ita.1',
             'tennis': 'tennis',
         }
+        
+        # Built once rather than on every request
+        self.sport_urls = {sport: f"{self.base_url}/{path}" for sport, path in self.sport_mappings.items()}
+        self._base_params = {"apikey": self.api_key} if self.api_key else {}
+        self.supported_sports = frozenset(self.sport_mappings)
     
     async def get_team_stats(self, sport: str, team_id: str, season: str) -> Dict[str, Any]:
         """Get team statistics from ESPN."""
-        sport_path = self.sport_mappings.get(sport)
-        if not sport_path:
+        sport_url = self.sport_urls.get(sport)
+        if not sport_url:
             logger.warning(f"Sport {sport} not supported by ESPN collector")
             return {}
         
         cache_key = self.get_cache_key("team_stats", sport, team_id, season)
-        url = f"{self.base_url}/{sport_path}/teams/{team_id}/statistics"
+        url = f"{sport_url}/teams/{team_id}/statistics"
         
-        params = {"season": season}
-        if self.api_key:
-            params["apikey"] = self.api_key
+        params = {"season": season, **self._base_params}
         
         data = await self.make_request(url, params, cache_key)
         
@@ -55,16 +58,14 @@ class ESPNCollector(BaseDataCollector):
     
     async def get_player_stats(self, sport: str, player_id: str, season: str) -> Dict[str, Any]:
         """Get player statistics from ESPN."""
-        sport_path = self.sport_mappings.get(sport)
-        if not sport_path:
+        sport_url = self.sport_urls.get(sport)
+        if not sport_url:
             return {}
         
         cache_key = self.get_cache_key("player_stats", sport, player_id, season)
-        url = f"{self.base_url}/{sport_path}/athletes/{player_id}/statistics"
+        url = f"{sport_url}/athletes/{player_id}/statistics"
         
-        params = {"season": season}
-        if self.api_key:
-            params["apikey"] = self.api_key
+        params = {"season": season, **self._base_params}
         
         data = await self.make_request(url, params, cache_key)
         
@@ -75,16 +76,14 @@ class ESPNCollector(BaseDataCollector):
     
     async def get_match_history(self, sport: str, team1_id: str, team2_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get head-to-head match history."""
-        sport_path = self.sport_mappings.get(sport)
-        if not sport_path:
+        sport_url = self.sport_urls.get(sport)
+        if not sport_url:
             return []
         
         cache_key = self.get_cache_key("match_history", sport, team1_id, team2_id, limit)
-        url = f"{self.base_url}/{sport_path}/teams/{team1_id}/events"
+        url = f"{sport_url}/teams/{team1_id}/events"
         
-        params = {"limit": limit * 2}  # Get more to filter for head-to-head
-        if self.api_key:
-            params["apikey"] = self.api_key
+        params = {"limit": limit * 2, **self._base_params}  # Get more to filter for head-to-head
         
         data = await self.make_request(url, params, cache_key)
         
@@ -102,12 +101,12 @@ class ESPNCollector(BaseDataCollector):
     
     async def get_upcoming_matches(self, sport: str, days_ahead: int = 7) -> List[Dict[str, Any]]:
         """Get upcoming matches."""
-        sport_path = self.sport_mappings.get(sport)
-        if not sport_path:
+        sport_url = self.sport_urls.get(sport)
+        if not sport_url:
             return []
         
         cache_key = self.get_cache_key("upcoming_matches", sport, days_ahead)
-        url = f"{self.base_url}/{sport_path}/scoreboard"
+        url = f"{sport_url}/scoreboard"
         
         # Calculate date range
         start_date = datetime.now().strftime("%Y%m%d")
@@ -115,10 +114,9 @@ class ESPNCollector(BaseDataCollector):
         
         params = {
             "dates": f"{start_date}-{end_date}",
-            "limit": 100
+            "limit": 100,
+            **self._base_params
         }
-        if self.api_key:
-            params["apikey"] = self.api_key
         
         data = await self.make_request(url, params, cache_key)
         
@@ -129,16 +127,14 @@ class ESPNCollector(BaseDataCollector):
     
     async def get_recent_matches(self, sport: str, team_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent matches for a team."""
-        sport_path = self.sport_mappings.get(sport)
-        if not sport_path:
+        sport_url = self.sport_urls.get(sport)
+        if not sport_url:
             return []
         
         cache_key = self.get_cache_key("recent_matches", sport, team_id, limit)
-        url = f"{self.base_url}/{sport_path}/teams/{team_id}/events"
+        url = f"{sport_url}/teams/{team_id}/events"
         
-        params = {"limit": limit}
-        if self.api_key:
-            params["apikey"] = self.api_key
+        params = {"limit": limit, **self._base_params}
         
         data = await self.make_request(url, params, cache_key)
         
@@ -184,33 +180,43 @@ class ESPNCollector(BaseDataCollector):
     
     def _parse_match(self, event_data: Dict) -> Dict[str, Any]:
         """Parse match/event data."""
-        competitors = event_data.get('competitions', [{}])[0].get('competitors', [])
+        competition = self._first_competition(event_data)
         
-        home_team = next((c for c in competitors if c.get('homeAway') == 'home'), {})
-        away_team = next((c for c in competitors if c.get('homeAway') == 'away'), {})
+        # Pick out home and away sides in one pass over the competitors
+        sides = {}
+        for competitor in competition.get('competitors', []):
+            sides.setdefault(competitor.get('homeAway'), competitor)
         
         return {
             'id': event_data.get('id'),
             'date': event_data.get('date'),
             'status': event_data.get('status', {}).get('type', {}).get('name'),
-            'home_team': {
-                'id': home_team.get('team', {}).get('id'),
-                'name': home_team.get('team', {}).get('displayName'),
-                'score': home_team.get('score'),
-                'record': home_team.get('records', [{}])[0].get('summary') if home_team.get('records') else None
-            },
-            'away_team': {
-                'id': away_team.get('team', {}).get('id'),
-                'name': away_team.get('team', {}).get('displayName'),
-                'score': away_team.get('score'),
-                'record': away_team.get('records', [{}])[0].get('summary') if away_team.get('records') else None
-            },
-            'venue': event_data.get('competitions', [{}])[0].get('venue', {}).get('fullName'),
+            'home_team': self._parse_competitor(sides.get('home', {})),
+            'away_team': self._parse_competitor(sides.get('away', {})),
+            'venue': (competition.get('venue') or {}).get('fullName'),
             'source': 'espn'
         }
     
+    @staticmethod
+    def _first_competition(event: Dict) -> Dict:
+        """Get an event's first competition, or an empty dict when it has none."""
+        competitions = event.get('competitions')
+        return competitions[0] if competitions else {}
+    
+    @staticmethod
+    def _parse_competitor(competitor: Dict) -> Dict[str, Any]:
+        """Parse one side of a match."""
+        team = competitor.get('team', {})
+        records = competitor.get('records')
+        return {
+            'id': team.get('id'),
+            'name': team.get('displayName'),
+            'score': competitor.get('score'),
+            'record': records[0].get('summary') if records else None
+        }
+    
     def _is_head_to_head_match(self, event: Dict, team1_id: str, team2_id: str) -> bool:
         """Check if event is a head-to-head match between two teams."""
-        competitors = event.get('competitions', [{}])[0].get('competitors', [])
-        team_ids = [c.get('team', {}).get('id') for c in competitors]
+        competitors = self._first_competition(event).get('competitors', ())
+        team_ids = {c.get('team', {}).get('id') for c in competitors}
         return team1_id in team_ids and team2_id in team_ids
@@ -0,0 +1,124 @@
+"""HTTP session shared by the data collectors and web scraper."""
+
+import asyncio
+from typing import Iterable, Optional, Set
+from urllib.parse import urlsplit
+import aiohttp
+import orjson
+
+# Connection pool limits for the shared session
+CONNECTOR_LIMIT = 256
+CONNECTOR_LIMIT_PER_HOST = 64
+# API hosts resolve to stable addresses, so their lookups are cached longer
+DNS_CACHE_TTL = 600
+# Keep idle pooled connections open across gaps between request bursts so
+# the next burst reuses them instead of paying new TCP/TLS handshakes
+KEEPALIVE_TIMEOUT = 60
+# Seconds left for pooled TLS connections to finish closing at shutdown
+SHUTDOWN_GRACE = 0.25
+
+# Fail fast on hosts that will not connect or stall mid-response, without
+# capping the total length of legitimate long reads
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=3, sock_read=10)
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+_session_refs = 0
+_session_lock: Optional[asyncio.Lock] = None
+# Origins the shared session has already opened a connection to
+_warmed_origins: Set[str] = set()
+
+
+async def acquire_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use.
+
+    Sharing one session lets every collector reuse pooled keep-alive
+    connections instead of paying a TCP/TLS handshake per instance.
+    """
+    global _shared_session, _session_refs, _session_lock
+    
+    if _session_lock is None:
+        _session_lock = asyncio.Lock()
+    
+    async with _session_lock:
+        if _shared_session is None or _shared_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTOR_LIMIT,
+                limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True
+            )
+            _shared_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=REQUEST_TIMEOUT,
+                headers={'User-Agent': 'Sports-Prediction-Bot/1.0'},
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+            _session_refs = 0
+        _session_refs += 1
+        return _shared_session
+
+
+async def warm_up(urls: Iterable[str]) -> None:
+    """Open pooled connections to the origins of urls ahead of real requests.
+
+    One HEAD per origin pays the DNS lookup and TCP/TLS handshake up front,
+    concurrently, so the first API calls reuse a ready connection.
+    """
+    session = _shared_session
+    if session is None or session.closed:
+        return
+    
+    origins = set()
+    for url in urls:
+        parts = urlsplit(url)
+        origins.add(f"{parts.scheme}://{parts.netloc}")
+    origins -= _warmed_origins
+    if not origins:
+        return
+    
+    async def head(origin: str) -> None:
+        async with session.head(origin, allow_redirects=False):
+            pass
+        # Any response means a pooled connection; a failed origin is retried next time
+        _warmed_origins.add(origin)
+    
+    # Real requests handle errors themselves
+    await asyncio.gather(*[head(origin) for origin in origins], return_exceptions=True)
+
+
+async def release_session() -> None:
+    """Release a reference to the shared session, closing it on last release."""
+    global _shared_session, _session_refs
+    
+    if _session_lock is None:
+        return  # Already closed by close_session
+    
+    async with _session_lock:
+        _session_refs -= 1
+        if _session_refs <= 0 and _shared_session is not None:
+            await _shared_session.close()
+            _shared_session = None
+            _session_refs = 0
+            _warmed_origins.clear()
+
+
+async def close_session() -> None:
+    """Close the shared session at shutdown, whatever references remain.
+
+    Leftover references come from components that never exited; closing
+    here still returns every pooled socket before the event loop ends.
+    """
+    global _shared_session, _session_refs, _session_lock
+    
+    session = _shared_session
+    _shared_session = None
+    _session_refs = 0
+    _warmed_origins.clear()
+    # A fresh lock is created on the next event loop that acquires a session
+    _session_lock = None
+    
+    if session is not None and not session.closed:
+        await session.close()
+        # Let TLS transports complete their close before the loop stops
+        await asyncio.sleep(SHUTDOWN_GRACE)
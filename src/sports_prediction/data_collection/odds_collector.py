@@ -1,6 +1,10 @@
 """Odds data collector for betting odds comparison."""
 
-from typing import Dict, List, Any, Optional
+import heapq
+import itertools
+import time
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from .base_collector import BaseDataCollector
 from ..utils.logger import get_logger
@@ -8,37 +12,59 @@ from ..config.settings import settings
 
 logger = get_logger(__name__)
 
+# Seconds a sport's indexed odds listing is reused across match lookups
+MATCH_INDEX_TTL = 60
+
+# Sport keys for The Odds API
+SPORT_KEYS = {
+    'nfl': 'americanfootball_nfl',
+    'nba': 'basketball_nba',
+    'mlb': 'baseball_mlb',
+    'nhl': 'icehockey_nhl',
+    'mls': 'soccer_usa_mls',
+    'premier_league': 'soccer_epl',
+    'champions_league': 'soccer_uefa_champs_league',
+    'la_liga': 'soccer_spain_la_liga',
+    'bundesliga': 'soccer_germany_bundesliga',
+    'serie_a': 'soccer_italy_serie_a',
+    'tennis': 'tennis_wta',
+    'ufc': 'mma_mixed_martial_arts',
+    'boxing': 'boxing_heavyweight',
+}
+
+# Sort key ranking arbitrage opportunities
+BY_PROFIT_MARGIN = itemgetter('profit_margin')
+
+# Popular bookmakers; pass as bookmakers= to restrict arbitrage scans to them
+BOOKMAKERS = frozenset({
+    'draftkings', 'fanduel', 'betmgm', 'caesars', 'pointsbet',
+    'bet365', 'pinnacle', 'betway', 'unibet'
+})
+
 
 class OddsCollector(BaseDataCollector):
     """Odds API data collector for betting odds."""
     
     def __init__(self):
-        super().__init__("odds")
+        super().__init__("odds", max_concurrent_requests=5)
         self.base_url = "https://api.the-odds-api.com/v4"
         self.api_key = settings.odds_api_key
+        # Every request needs an API key
+        self.supported_sports = frozenset(SPORT_KEYS) if self.api_key else frozenset()
         
-        # Sport keys for The Odds API
-        self.sport_keys = {
-            'nfl': 'americanfootball_nfl',
-            'nba': 'basketball_nba',
-            'mlb': 'baseball_mlb',
-            'nhl': 'icehockey_nhl',
-            'mls': 'soccer_usa_mls',
-            'premier_league': 'soccer_epl',
-            'champions_league': 'soccer_uefa_champs_league',
-            'la_liga': 'soccer_spain_la_liga',
-            'bundesliga': 'soccer_germany_bundesliga',
-            'serie_a': 'soccer_italy_serie_a',
-            'tennis': 'tennis_wta',
-            'ufc': 'mma_mixed_martial_arts',
-            'boxing': 'boxing_heavyweight',
+        # Query parameters shared by every odds request
+        self._live_params = {
+            'apiKey': self.api_key,
+            'regions': 'us,uk,eu',
+            'markets': 'h2h,spreads,totals',
+            'oddsFormat': 'decimal'
         }
+        self._upcoming_params = {**self._live_params, 'dateFormat': 'iso'}
         
-        # Popular bookmakers
-        self.bookmakers = [
-            'draftkings', 'fanduel', 'betmgm', 'caesars', 'pointsbet',
-            'bet365', 'pinnacle', 'betway', 'unibet'
-        ]
+        # Upcoming odds indexed by home team, per sport and time bucket
+        self._match_index: Dict[str, Tuple[int, Dict[Any, List[Dict[str, Any]]]]] = {}
+        # Last parsed odds listing per cache key, with the raw payload it came from
+        self._parsed_events: Dict[str, Tuple[Any, List[Dict[str, Any]]]] = {}
     
     async def get_team_stats(self, sport: str, team_id: str, season: str) -> Dict[str, Any]:
         """Odds collector doesn't provide team stats."""
@@ -56,7 +82,7 @@ class OddsCollector(BaseDataCollector):
     
     async def get_upcoming_matches(self, sport: str, days_ahead: int = 7) -> List[Dict[str, Any]]:
         """Get upcoming matches with odds."""
-        sport_key = self.sport_keys.get(sport)
+        sport_key = SPORT_KEYS.get(sport)
         if not sport_key or not self.api_key:
             logger.warning(f"Sport {sport} not supported or API key missing for odds collector")
             return []
@@ -64,42 +90,76 @@ class OddsCollector(BaseDataCollector):
         cache_key = self.get_cache_key("upcoming_odds", sport, days_ahead)
         url = f"{self.base_url}/sports/{sport_key}/odds"
         
-        params = {
-            'apiKey': self.api_key,
-            'regions': 'us,uk,eu',
-            'markets': 'h2h,spreads,totals',
-            'oddsFormat': 'decimal',
-            'dateFormat': 'iso'
-        }
-        
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._upcoming_params, cache_key)
         
         if data:
-            return [self._parse_odds_event(event) for event in data]
+            # Local cache hits return the same payload object, so reuse its parse;
+            # holding the payload keeps its identity from being recycled
+            parsed = self._parsed_events.get(cache_key)
+            if parsed is None or parsed[0] is not data:
+                parsed = (data, [self._parse_odds_event(event) for event in data])
+                self._parsed_events[cache_key] = parsed
+            # Callers may annotate matches, so each gets its own copies
+            return [dict(event) for event in parsed[1]]
         
         return []
     
+    async def get_match_odds(self, sport: str, home_team_id: str, away_team_id: str,
+                             home_name: str = '', away_name: str = '') -> Optional[Dict[str, Any]]:
+        """Get odds for a single upcoming match, matched by team id or by team name."""
+        if not self.supports(sport):
+            return None
+        
+        by_home = await self._get_match_index(sport)
+        
+        def away_matches(match: Dict[str, Any]) -> bool:
+            away_team = match.get('away_team')
+            return away_team == away_team_id or (isinstance(away_team, str) and away_team in away_name)
+        
+        for match in by_home.get(home_team_id, []):
+            if away_matches(match):
+                return match
+        
+        # Fall back to home teams whose name appears in the given team name
+        for home_team, matches in by_home.items():
+            if isinstance(home_team, str) and home_team != home_team_id and home_team in home_name:
+                for match in matches:
+                    if away_matches(match):
+                        return match
+        
+        return None
+    
+    async def _get_match_index(self, sport: str) -> Dict[Any, List[Dict[str, Any]]]:
+        """Get upcoming odds indexed by home team, reused for a short while per sport."""
+        bucket = int(time.time() // MATCH_INDEX_TTL)
+        cached = self._match_index.get(sport)
+        if cached and cached[0] == bucket:
+            return cached[1]
+        
+        # The API has no per-fixture lookup by team, so index the sport listing
+        by_home: Dict[Any, List[Dict[str, Any]]] = {}
+        for match in await self.get_upcoming_matches(sport):
+            by_home.setdefault(match.get('home_team'), []).append(match)
+        
+        # Keep failed fetches out so the next lookup retries
+        if by_home:
+            self._match_index[sport] = (bucket, by_home)
+        return by_home
+    
     async def get_recent_matches(self, sport: str, team_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Odds collector focuses on upcoming matches."""
         return []
     
     async def get_live_odds(self, sport: str, event_id: str) -> Dict[str, Any]:
         """Get live odds for a specific event."""
-        sport_key = self.sport_keys.get(sport)
+        sport_key = SPORT_KEYS.get(sport)
         if not sport_key or not self.api_key:
             return {}
         
         cache_key = self.get_cache_key("live_odds", sport, event_id)
         url = f"{self.base_url}/sports/{sport_key}/events/{event_id}/odds"
         
-        params = {
-            'apiKey': self.api_key,
-            'regions': 'us,uk,eu',
-            'markets': 'h2h,spreads,totals',
-            'oddsFormat': 'decimal'
-        }
-        
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._live_params, cache_key)
         
         if data:
             return self._parse_odds_event(data)
@@ -121,41 +181,41 @@ class OddsCollector(BaseDataCollector):
             'markets': {}
         }
         
-        # Process each market type
+        markets = comparison['markets']
+        
+        # Index every price by market, outcome and bookmaker in one pass
         for bookmaker in odds_data['bookmakers']:
+            title = bookmaker['title']
             for market in bookmaker.get('markets', []):
-                market_key = market['key']
-                
-                if market_key not in comparison['markets']:
-                    comparison['markets'][market_key] = {
+                market_comparison = markets.get(market['key'])
+                if market_comparison is None:
+                    market_comparison = markets[market['key']] = {
                         'outcomes': {},
                         'best_odds': {},
                         'bookmaker_odds': {}
                     }
+                bookmaker_odds = market_comparison['bookmaker_odds']
                 
-                # Track odds for each outcome
                 for outcome in market.get('outcomes', []):
-                    outcome_name = outcome['name']
-                    odds_value = outcome['price']
-                    
-                    # Track best odds
-                    if (outcome_name not in comparison['markets'][market_key]['best_odds'] or
-                        odds_value > comparison['markets'][market_key]['best_odds'][outcome_name]['odds']):
-                        comparison['markets'][market_key]['best_odds'][outcome_name] = {
-                            'odds': odds_value,
-                            'bookmaker': bookmaker['title']
-                        }
-                    
-                    # Track all bookmaker odds
-                    if outcome_name not in comparison['markets'][market_key]['bookmaker_odds']:
-                        comparison['markets'][market_key]['bookmaker_odds'][outcome_name] = {}
-                    
-                    comparison['markets'][market_key]['bookmaker_odds'][outcome_name][bookmaker['title']] = odds_value
+                    bookmaker_odds.setdefault(outcome['name'], {})[title] = outcome['price']
+        
+        # Best odds per outcome; max keeps the first bookmaker on ties
+        for market_comparison in markets.values():
+            best_odds = market_comparison['best_odds']
+            for outcome_name, prices in market_comparison['bookmaker_odds'].items():
+                title, odds_value = max(prices.items(), key=itemgetter(1))
+                best_odds[outcome_name] = {'odds': odds_value, 'bookmaker': title}
         
         return comparison
     
-    async def get_arbitrage_opportunities(self, sport: str) -> List[Dict[str, Any]]:
-        """Find arbitrage betting opportunities."""
+    async def get_arbitrage_opportunities(self, sport: str, top_k: Optional[int] = None,
+                                          bookmakers: Optional[FrozenSet[str]] = None) -> List[Dict[str, Any]]:
+        """Find arbitrage betting opportunities, best first; top_k limits how many.
+        
+        By default every bookmaker is considered. Passing bookmakers (e.g.
+        BOOKMAKERS) skips the others, which is faster but drops any
+        opportunity that needs one of their prices.
+        """
         upcoming_matches = await self.get_upcoming_matches(sport)
         arbitrage_opportunities = []
         
@@ -164,7 +224,7 @@ class OddsCollector(BaseDataCollector):
                 continue
             
             # Check for arbitrage in h2h market
-            h2h_arb = self._check_arbitrage_h2h(match)
+            h2h_arb = self._check_arbitrage_h2h(match, bookmakers)
             if h2h_arb:
                 arbitrage_opportunities.append({
                     'event_id': match['id'],
@@ -175,7 +235,28 @@ class OddsCollector(BaseDataCollector):
                     'profit_margin': h2h_arb['profit_margin']
                 })
         
-        return sorted(arbitrage_opportunities, key=lambda x: x['profit_margin'], reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(top_k, arbitrage_opportunities, key=BY_PROFIT_MARGIN)
+        arbitrage_opportunities.sort(key=BY_PROFIT_MARGIN, reverse=True)
+        return arbitrage_opportunities
+    
+    async def get_many_arbitrage_opportunities(self, sports: List[str], top_k: Optional[int] = None,
+                                               bookmakers: Optional[FrozenSet[str]] = None) -> List[Dict[str, Any]]:
+        """Find arbitrage opportunities across several sports concurrently."""
+        sports = [sport for sport in sports if self.supports(sport)]
+        results = await self._gather_bounded([
+            self.get_arbitrage_opportunities(sport, top_k, bookmakers) for sport in sports
+        ])
+        
+        ranked = []
+        for sport, result in zip(sports, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error finding arbitrage opportunities for {sport}: {result}")
+            else:
+                ranked.append(result)
+        
+        # Each sport's list is already ranked, so merge rather than re-sort
+        return list(itertools.islice(heapq.merge(*ranked, key=BY_PROFIT_MARGIN, reverse=True), top_k))
     
     def _parse_odds_event(self, event_data: Dict) -> Dict[str, Any]:
         """Parse odds event data."""
@@ -190,24 +271,33 @@ class OddsCollector(BaseDataCollector):
             'source': 'odds_api'
         }
     
-    def _check_arbitrage_h2h(self, match: Dict) -> Optional[Dict[str, Any]]:
-        """Check for arbitrage opportunity in head-to-head market."""
+    def _check_arbitrage_h2h(self, match: Dict,
+                             bookmakers: Optional[FrozenSet[str]] = None) -> Optional[Dict[str, Any]]:
+        """Check for arbitrage opportunity in head-to-head market, optionally among bookmakers only."""
         best_home_odds = 0
         best_away_odds = 0
         best_home_bookmaker = ""
         best_away_bookmaker = ""
+        home_team = match['home_team']
+        away_team = match['away_team']
         
         # Find best odds for each outcome
         for bookmaker in match.get('bookmakers', []):
+            if bookmakers is not None and bookmaker.get('key') not in bookmakers:
+                continue
             for market in bookmaker.get('markets', []):
-                if market['key'] == 'h2h':
-                    for outcome in market.get('outcomes', []):
-                        if outcome['name'] == match['home_team'] and outcome['price'] > best_home_odds:
-                            best_home_odds = outcome['price']
+                if market['key'] != 'h2h':
+                    continue
+                for outcome in market.get('outcomes', []):
+                    name = outcome['name']
+                    price = outcome['price']
+                    if name == home_team:
+                        if price > best_home_odds:
+                            best_home_odds = price
                             best_home_bookmaker = bookmaker['title']
-                        elif outcome['name'] == match['away_team'] and outcome['price'] > best_away_odds:
-                            best_away_odds = outcome['price']
-                            best_away_bookmaker = bookmaker['title']
+                    elif name == away_team and price > best_away_odds:
+                        best_away_odds = price
+                        best_away_bookmaker = bookmaker['title']
         
         if best_home_odds > 0 and best_away_odds > 0:
             # Calculate implied probabilities
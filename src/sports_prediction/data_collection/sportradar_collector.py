@@ -1,77 +1,119 @@
 """SportRadar data collector for comprehensive sports data."""
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import asyncio
+import itertools
+from typing import Callable, Dict, List, Any, Optional
+from datetime import datetime, timedelta, timezone
 from .base_collector import BaseDataCollector
 from ..utils.logger import get_logger
 from ..config.settings import settings
 
 logger = get_logger(__name__)
 
+BASE_URL = "https://api.sportradar.us"
+
+# Sport API endpoints for SportRadar
+SPORT_ENDPOINTS = {
+    'nfl': f"{BASE_URL}/nfl/official/trial/v7/en",
+    'nba': f"{BASE_URL}/nba/trial/v8/en",
+    'mlb': f"{BASE_URL}/mlb/trial/v7/en",
+    'nhl': f"{BASE_URL}/nhl/trial/v7/en",
+    'mls': f"{BASE_URL}/soccer-t3/global/trial/v4/en",
+    'premier_league': f"{BASE_URL}/soccer-t3/global/trial/v4/en",
+    'champions_league': f"{BASE_URL}/soccer-t3/global/trial/v4/en",
+    'tennis': f"{BASE_URL}/tennis/trial/v3/en",
+}
+
+# League IDs for soccer competitions
+SOCCER_LEAGUES = {
+    'mls': 'sr:tournament:242',
+    'premier_league': 'sr:tournament:17',
+    'champions_league': 'sr:tournament:7',
+    'la_liga': 'sr:tournament:8',
+    'bundesliga': 'sr:tournament:35',
+    'serie_a': 'sr:tournament:23',
+}
+
+# Sports served by the soccer API rather than a US sport API
+SOCCER_SPORTS = frozenset(SOCCER_LEAGUES)
+
+# Seconds a failed head-to-head lookup is remembered, so pairs the plan
+# does not serve (e.g. 404s on trial keys) skip straight to the fallback
+# instead of spending a request slot on the same failure every time
+VERSUS_MISS_TTL = 600
+
+
+def _parse_scheduled(value: Optional[str]) -> Optional[datetime]:
+    """Parse a scheduled time as an aware datetime, treating a missing offset as UTC.
+    
+    Returns None for a missing or malformed value, so one bad row does not
+    abort a whole schedule.
+    """
+    if not value:
+        return None
+    try:
+        # fromisoformat is C-implemented; before Python 3.11 it rejects a trailing 'Z'
+        scheduled = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        logger.warning(f"Skipping malformed scheduled time: {value!r}")
+        return None
+    return scheduled if scheduled.tzinfo else scheduled.replace(tzinfo=timezone.utc)
+
 
 class SportRadarCollector(BaseDataCollector):
     """SportRadar API data collector."""
     
     def __init__(self):
-        super().__init__("sportradar")
-        self.base_url = "https://api.sportradar.us"
+        super().__init__("sportradar", max_concurrent_requests=5)
+        self.base_url = BASE_URL
         self.api_key = settings.sportradar_api_key
-        
-        # Sport API endpoints for SportRadar
-        self.sport_endpoints = {
-            'nfl': f"{self.base_url}/nfl/official/trial/v7/en",
-            'nba': f"{self.base_url}/nba/trial/v8/en",
-            'mlb': f"{self.base_url}/mlb/trial/v7/en",
-            'nhl': f"{self.base_url}/nhl/trial/v7/en",
-            'mls': f"{self.base_url}/soccer-t3/global/trial/v4/en",
-            'premier_league': f"{self.base_url}/soccer-t3/global/trial/v4/en",
-            'champions_league': f"{self.base_url}/soccer-t3/global/trial/v4/en",
-            'tennis': f"{self.base_url}/tennis/trial/v3/en",
-        }
-        
-        # League IDs for soccer competitions
-        self.soccer_leagues = {
-            'mls': 'sr:tournament:242',
-            'premier_league': 'sr:tournament:17',
-            'champions_league': 'sr:tournament:7',
-            'la_liga': 'sr:tournament:8',
-            'bundesliga': 'sr:tournament:35',
-            'serie_a': 'sr:tournament:23',
-        }
+        self._base_params = {"api_key": self.api_key} if self.api_key else {}
+        self.supported_sports = frozenset(SPORT_ENDPOINTS)
+        
+        # Per-sport fetchers, so each call dispatches with a single lookup
+        self._team_stats_fns = self._dispatch_table(self._get_soccer_team_stats, self._get_us_sport_team_stats)
+        self._player_stats_fns = self._dispatch_table(self._get_soccer_player_stats, self._get_us_sport_player_stats)
+        self._upcoming_fns = self._dispatch_table(self._get_soccer_upcoming_matches, self._get_us_sport_upcoming_matches)
+        self._recent_fns = self._dispatch_table(self._get_soccer_recent_matches, self._get_us_sport_recent_matches)
+    
+    @staticmethod
+    def _dispatch_table(soccer_fn: Callable, us_sport_fn: Callable) -> Dict[str, Callable]:
+        """Map each supported sport to its soccer or US sport fetcher."""
+        return {sport: soccer_fn if sport in SOCCER_SPORTS else us_sport_fn for sport in SPORT_ENDPOINTS}
     
     async def get_team_stats(self, sport: str, team_id: str, season: str) -> Dict[str, Any]:
         """Get team statistics from SportRadar."""
-        if sport not in self.sport_endpoints:
+        fetch = self._team_stats_fns.get(sport)
+        if not fetch:
             logger.warning(f"Sport {sport} not supported by SportRadar collector")
             return {}
         
         cache_key = self.get_cache_key("team_stats", sport, team_id, season)
-        
-        if sport in ['mls', 'premier_league', 'champions_league', 'la_liga', 'bundesliga', 'serie_a']:
-            return await self._get_soccer_team_stats(sport, team_id, season, cache_key)
-        else:
-            return await self._get_us_sport_team_stats(sport, team_id, season, cache_key)
+        return await fetch(sport, team_id, season, cache_key)
     
     async def get_player_stats(self, sport: str, player_id: str, season: str) -> Dict[str, Any]:
         """Get player statistics from SportRadar."""
-        if sport not in self.sport_endpoints:
+        fetch = self._player_stats_fns.get(sport)
+        if not fetch:
             return {}
         
         cache_key = self.get_cache_key("player_stats", sport, player_id, season)
-        
-        if sport in ['mls', 'premier_league', 'champions_league', 'la_liga', 'bundesliga', 'serie_a']:
-            return await self._get_soccer_player_stats(sport, player_id, season, cache_key)
-        else:
-            return await self._get_us_sport_player_stats(sport, player_id, season, cache_key)
+        return await fetch(sport, player_id, season, cache_key)
     
     async def get_match_history(self, sport: str, team1_id: str, team2_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get head-to-head match history."""
-        if sport not in self.sport_endpoints:
+        if sport not in SPORT_ENDPOINTS:
             return []
         
         cache_key = self.get_cache_key("match_history", sport, team1_id, team2_id, limit)
         
-        # Get recent matches for team1 and filter for head-to-head
+        # The soccer API lists past meetings of two teams directly
+        if sport in SOCCER_SPORTS:
+            h2h_matches = await self._get_soccer_versus_matches(sport, team1_id, team2_id, limit, cache_key)
+            if h2h_matches is not None:
+                return h2h_matches
+        
+        # Otherwise get recent matches for team1 and filter for head-to-head
         team1_matches = await self.get_recent_matches(sport, team1_id, limit * 3)
         
         h2h_matches = []
@@ -85,35 +127,28 @@ class SportRadarCollector(BaseDataCollector):
     
     async def get_upcoming_matches(self, sport: str, days_ahead: int = 7) -> List[Dict[str, Any]]:
         """Get upcoming matches."""
-        if sport not in self.sport_endpoints:
+        fetch = self._upcoming_fns.get(sport)
+        if not fetch:
             return []
         
         cache_key = self.get_cache_key("upcoming_matches", sport, days_ahead)
-        
-        if sport in ['mls', 'premier_league', 'champions_league', 'la_liga', 'bundesliga', 'serie_a']:
-            return await self._get_soccer_upcoming_matches(sport, days_ahead, cache_key)
-        else:
-            return await self._get_us_sport_upcoming_matches(sport, days_ahead, cache_key)
+        return await fetch(sport, days_ahead, cache_key)
     
     async def get_recent_matches(self, sport: str, team_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent matches for a team."""
-        if sport not in self.sport_endpoints:
+        fetch = self._recent_fns.get(sport)
+        if not fetch:
             return []
         
         cache_key = self.get_cache_key("recent_matches", sport, team_id, limit)
-        
-        if sport in ['mls', 'premier_league', 'champions_league', 'la_liga', 'bundesliga', 'serie_a']:
-            return await self._get_soccer_recent_matches(sport, team_id, limit, cache_key)
-        else:
-            return await self._get_us_sport_recent_matches(sport, team_id, limit, cache_key)
+        return await fetch(sport, team_id, limit, cache_key)
     
     async def _get_us_sport_team_stats(self, sport: str, team_id: str, season: str, cache_key: str) -> Dict[str, Any]:
         """Get US sport team statistics."""
-        base_url = self.sport_endpoints[sport]
+        base_url = SPORT_ENDPOINTS[sport]
         url = f"{base_url}/seasons/{season}/teams/{team_id}/statistics.json"
         
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._base_params, cache_key)
         
         if data:
             return self._parse_us_sport_team_stats(data)
@@ -121,16 +156,15 @@ class SportRadarCollector(BaseDataCollector):
     
     async def _get_soccer_team_stats(self, sport: str, team_id: str, season: str, cache_key: str) -> Dict[str, Any]:
         """Get soccer team statistics."""
-        base_url = self.sport_endpoints[sport]
-        league_id = self.soccer_leagues.get(sport)
+        base_url = SPORT_ENDPOINTS[sport]
+        league_id = SOCCER_LEAGUES.get(sport)
         
         if not league_id:
             return {}
         
         url = f"{base_url}/tournaments/{league_id}/seasons/{season}/teams/{team_id}/statistics.json"
         
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._base_params, cache_key)
         
         if data:
             return self._parse_soccer_team_stats(data)
@@ -138,32 +172,29 @@ class SportRadarCollector(BaseDataCollector):
     
     async def _get_us_sport_upcoming_matches(self, sport: str, days_ahead: int, cache_key: str) -> List[Dict[str, Any]]:
         """Get upcoming US sport matches."""
-        base_url = self.sport_endpoints[sport]
-        
-        # Get current season schedule
-        current_year = datetime.now().year
-        url = f"{base_url}/games/{current_year}/schedule.json"
-        
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
-        
-        if data and 'games' in data:
-            upcoming = []
-            cutoff_date = datetime.now() + timedelta(days=days_ahead)
-            
-            for game in data['games']:
-                game_date = datetime.fromisoformat(game.get('scheduled', '').replace('Z', '+00:00'))
-                if datetime.now() <= game_date <= cutoff_date:
-                    upcoming.append(self._parse_us_sport_match(game))
-            
-            return upcoming
-        
-        return []
+        base_url = SPORT_ENDPOINTS[sport]
+        now = datetime.now(timezone.utc)
+        cutoff_date = now + timedelta(days=days_ahead)
+        
+        # Get each season schedule the window reaches into, concurrently
+        years = range(now.year, cutoff_date.year + 1)
+        schedules = await asyncio.gather(*[
+            self.make_request(f"{base_url}/games/{year}/schedule.json", self._base_params, f"{cache_key}:{year}")
+            for year in years
+        ])
+        
+        upcoming = []
+        for game in itertools.chain.from_iterable(data.get('games', ()) for data in schedules if data):
+            game_date = _parse_scheduled(game.get('scheduled'))
+            if game_date and now <= game_date <= cutoff_date:
+                upcoming.append(self._parse_us_sport_match(game))
+        
+        return upcoming
     
     async def _get_soccer_upcoming_matches(self, sport: str, days_ahead: int, cache_key: str) -> List[Dict[str, Any]]:
         """Get upcoming soccer matches."""
-        base_url = self.sport_endpoints[sport]
-        league_id = self.soccer_leagues.get(sport)
+        base_url = SPORT_ENDPOINTS[sport]
+        league_id = SOCCER_LEAGUES.get(sport)
         
         if not league_id:
             return []
@@ -172,16 +203,16 @@ class SportRadarCollector(BaseDataCollector):
         current_year = datetime.now().year
         url = f"{base_url}/tournaments/{league_id}/seasons/{current_year}/schedule.json"
         
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._base_params, cache_key)
         
         if data and 'sport_events' in data:
             upcoming = []
-            cutoff_date = datetime.now() + timedelta(days=days_ahead)
+            now = datetime.now(timezone.utc)
+            cutoff_date = now + timedelta(days=days_ahead)
             
             for event in data['sport_events']:
-                event_date = datetime.fromisoformat(event.get('scheduled', '').replace('Z', '+00:00'))
-                if datetime.now() <= event_date <= cutoff_date:
+                event_date = _parse_scheduled(event.get('scheduled'))
+                if event_date and now <= event_date <= cutoff_date:
                     upcoming.append(self._parse_soccer_match(event))
             
             return upcoming
@@ -235,9 +266,12 @@ class SportRadarCollector(BaseDataCollector):
     
     def _parse_soccer_match(self, event_data: Dict) -> Dict[str, Any]:
         """Parse soccer match data."""
-        competitors = event_data.get('competitors', [])
-        home_team = next((c for c in competitors if c.get('qualifier') == 'home'), {})
-        away_team = next((c for c in competitors if c.get('qualifier') == 'away'), {})
+        # Pick out home and away sides in one pass over the competitors
+        sides = {}
+        for competitor in event_data.get('competitors', []):
+            sides.setdefault(competitor.get('qualifier'), competitor)
+        home_team = sides.get('home', {})
+        away_team = sides.get('away', {})
         
         return {
             'id': event_data.get('id'),
@@ -257,11 +291,10 @@ class SportRadarCollector(BaseDataCollector):
     
     async def _get_us_sport_player_stats(self, sport: str, player_id: str, season: str, cache_key: str) -> Dict[str, Any]:
         """Get US sport player statistics."""
-        base_url = self.sport_endpoints[sport]
+        base_url = SPORT_ENDPOINTS[sport]
         url = f"{base_url}/players/{player_id}/profile.json"
 
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._base_params, cache_key)
 
         if data:
             return self._parse_us_sport_player_stats(data)
@@ -269,11 +302,10 @@ class SportRadarCollector(BaseDataCollector):
 
     async def _get_soccer_player_stats(self, sport: str, player_id: str, season: str, cache_key: str) -> Dict[str, Any]:
         """Get soccer player statistics."""
-        base_url = self.sport_endpoints[sport]
+        base_url = SPORT_ENDPOINTS[sport]
         url = f"{base_url}/players/{player_id}/profile.json"
 
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._base_params, cache_key)
 
         if data:
             return self._parse_soccer_player_stats(data)
@@ -281,18 +313,20 @@ class SportRadarCollector(BaseDataCollector):
 
     async def _get_us_sport_recent_matches(self, sport: str, team_id: str, limit: int, cache_key: str) -> List[Dict[str, Any]]:
         """Get recent US sport matches for a team."""
-        base_url = self.sport_endpoints[sport]
+        base_url = SPORT_ENDPOINTS[sport]
         current_year = datetime.now().year
         url = f"{base_url}/teams/{team_id}/schedule.json"
 
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._base_params, cache_key)
 
         if data and 'games' in data:
             recent = []
+            now = datetime.now(timezone.utc)
             for game in data['games']:
-                game_date = datetime.fromisoformat(game.get('scheduled', '').replace('Z', '+00:00'))
-                if game_date <= datetime.now() and game.get('status') == 'closed':
+                if game.get('status') != 'closed':
+                    continue
+                game_date = _parse_scheduled(game.get('scheduled'))
+                if game_date and game_date <= now:
                     recent.append(self._parse_us_sport_match(game))
                     if len(recent) >= limit:
                         break
@@ -301,11 +335,10 @@ class SportRadarCollector(BaseDataCollector):
 
     async def _get_soccer_recent_matches(self, sport: str, team_id: str, limit: int, cache_key: str) -> List[Dict[str, Any]]:
         """Get recent soccer matches for a team."""
-        base_url = self.sport_endpoints[sport]
+        base_url = SPORT_ENDPOINTS[sport]
         url = f"{base_url}/teams/{team_id}/results.json"
 
-        params = {"api_key": self.api_key} if self.api_key else {}
-        data = await self.make_request(url, params, cache_key)
+        data = await self.make_request(url, self._base_params, cache_key)
 
         if data and 'results' in data:
             recent = []
@@ -314,6 +347,23 @@ class SportRadarCollector(BaseDataCollector):
             return recent
         return []
 
+    async def _get_soccer_versus_matches(self, sport: str, team1_id: str, team2_id: str, limit: int,
+                                         cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get past meetings of two soccer teams, or None when the endpoint gave nothing."""
+        base_url = SPORT_ENDPOINTS[sport]
+        url = f"{base_url}/teams/{team1_id}/versus/{team2_id}/matches.json"
+        miss_key = f"{cache_key}:versus_miss"
+        if self.cache.get(miss_key):
+            return None
+
+        data = await self.make_request(url, self._base_params, cache_key)
+
+        if data is None:
+            self.cache.set(miss_key, True, ttl=VERSUS_MISS_TTL)
+            return None
+        meetings = data.get('last_meetings', {}).get('results', [])
+        return [self._parse_soccer_match(meeting.get('sport_event', meeting)) for meeting in meetings[:limit]]
+
     def _parse_us_sport_player_stats(self, data: Dict) -> Dict[str, Any]:
         """Parse US sport player statistics."""
         player = data.get('player', {})
@@ -1,15 +1,13 @@
 """Web scraper for additional sports data sources."""
 
 import asyncio
-from typing import Dict, List, Any, Optional
+import functools
+import random
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import aiohttp
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from .http_client import acquire_session, release_session
 from ..utils.cache import CacheManager
 from ..utils.rate_limiter import RateLimiter
 from ..utils.logger import get_logger
@@ -17,6 +15,65 @@ from ..config.settings import settings
 
 logger = get_logger(__name__)
 
+# Requests a single site may have in flight at once; the sites throttle
+# aggressive clients, so concurrency comes from scraping sites in parallel
+SCRAPE_CONCURRENCY_PER_SOURCE = 2
+
+# Sent with every scrape; sites serve browsers the pages being parsed
+SCRAPER_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    )
+}
+
+# Soccer competitions covered by the soccer-only sites
+SOCCER_SPORTS = frozenset({
+    'mls', 'premier_league', 'la_liga', 'bundesliga', 'serie_a', 'champions_league'
+})
+
+# Site search endpoints queried by name
+TRANSFERMARKT_SEARCH_URL = (
+    "https://www.transfermarkt.com/schnellsuche/ergebnis/schnellsuche"
+)
+FBREF_SEARCH_URL = "https://fbref.com/en/search/search.fcgi"
+BASKETBALL_REFERENCE_SEARCH_URL = (
+    "https://www.basketball-reference.com/search/search.fcgi"
+)
+
+# Seconds a scraped page is cached, give or take a random jitter so pages
+# scraped together do not all expire and get re-scraped together
+SCRAPE_TTL = 3600
+SCRAPE_TTL_JITTER = 300
+
+# Seconds a failed or empty scrape is remembered so retries do not hit the
+# site again; kept short so a transient failure soon clears
+MISS_TTL = 300
+MISS_TTL_JITTER = 60
+
+# Key in a cached scrape result that marks it as a remembered miss
+MISS_MARKER = '__miss__'
+
+# Headless Chrome flags for pages that need JavaScript rendered; every
+# current scraper fetches plain HTML, so Selenium is only imported on demand
+CHROME_ARGUMENTS = (
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080"
+)
+
+
+def _jittered(ttl: int, jitter: int) -> int:
+    """Spread a TTL by up to jitter seconds either way."""
+    return ttl + random.randint(-jitter, jitter)
+
+
+def _is_miss(value: Any) -> bool:
+    """Whether a cached scrape result is a remembered miss."""
+    return isinstance(value, dict) and value.get(MISS_MARKER, False)
+
 
 class WebScraper:
     """Web scraper for sports data from various websites."""
@@ -25,14 +82,8 @@ class WebScraper:
         self.cache = CacheManager()
         self.rate_limiter = RateLimiter()
         self.session: Optional[aiohttp.ClientSession] = None
-        
-        # Chrome options for Selenium
-        self.chrome_options = Options()
-        self.chrome_options.add_argument("--headless")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.chrome_options.add_argument("--disable-gpu")
-        self.chrome_options.add_argument("--window-size=1920,1080")
+        # Requests each site may have on the wire at once, created per source on use
+        self._source_semaphores: Dict[str, asyncio.Semaphore] = {}
         
         # Target websites
         self.scrapers = {
@@ -43,88 +94,163 @@ class WebScraper:
             'hockey_reference': self._scrape_hockey_reference,
         }
     
+    @functools.cached_property
+    def chrome_options(self):
+        """Chrome options for Selenium, built on first use."""
+        from selenium.webdriver.chrome.options import Options
+        
+        options = Options()
+        for argument in CHROME_ARGUMENTS:
+            options.add_argument(argument)
+        return options
+    
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-        )
+        self.session = await acquire_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self.session:
-            await self.session.close()
+            self.session = None
+            await release_session()
     
-    async def scrape_team_data(self, source: str, sport: str, team_name: str) -> Dict[str, Any]:
-        """Scrape team data from specified source."""
-        if source not in self.scrapers:
-            logger.warning(f"Scraper for {source} not implemented")
-            return {}
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, acquiring it on first use outside ``async with``."""
+        if self.session is None:
+            session = await acquire_session()
+            if self.session is None:
+                self.session = session
+            else:
+                await release_session()  # A concurrent scrape got there first
+        return self.session
+    
+    def _source_slots(self, source: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent requests to a source."""
+        semaphore = self._source_semaphores.get(source)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY_PER_SOURCE)
+            self._source_semaphores[source] = semaphore
+        return semaphore
+    
+    async def scrape_many(
+        self, requests: List[Tuple[str, str, str]]
+    ) -> List[Dict[str, Any]]:
+        """Scrape many (source, sport, team name) requests concurrently.
         
-        cache_key = f"scrape:{source}:{sport}:{team_name}"
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            return cached_data
+        Results follow the order of requests; each site's own concurrency
+        limit and rate limit still apply. Cached results are looked up and
+        fresh ones stored with one cache round trip each.
+        """
+        keys = [
+            f"scrape:{source}:{sport}:{team_name}"
+            for source, sport, team_name in requests
+        ]
+        cached = await asyncio.to_thread(self.cache.mget, list(set(keys)))
         
-        try:
-            data = await self.scrapers[source](sport, team_name, 'team')
-            if data:
-                self.cache.set(cache_key, data, ttl=3600)  # Cache for 1 hour
-            return data
-        except Exception as e:
-            logger.error(f"Error scraping {source} for {team_name}: {e}")
-            return {}
+        misses = {
+            key: request for key, request in zip(keys, requests)
+            if key not in cached and request[0] in self.scrapers
+        }
+        scraped = await asyncio.gather(*[
+            self._scrape(source, sport, team_name, 'team')
+            for source, sport, team_name in misses.values()
+        ])
+        
+        fresh = {key: data for key, data in zip(misses, scraped) if data}
+        failed = {
+            key: self._miss_sentinel()
+            for key, data in zip(misses, scraped) if not data
+        }
+        fresh_ttl = _jittered(SCRAPE_TTL, SCRAPE_TTL_JITTER)
+        miss_ttl = _jittered(MISS_TTL, MISS_TTL_JITTER)
+        await asyncio.gather(
+            asyncio.to_thread(self.cache.mset, fresh, fresh_ttl),
+            asyncio.to_thread(self.cache.mset, failed, miss_ttl)
+        )
+        
+        results = []
+        for key, (source, _, _) in zip(keys, requests):
+            if source not in self.scrapers:
+                logger.warning(f"Scraper for {source} not implemented")
+            data = cached.get(key) or fresh.get(key)
+            results.append({} if not data or _is_miss(data) else data)
+        return results
+    
+    async def scrape_team_data(self, source: str, sport: str, team_name: str) -> Dict[str, Any]:
+        """Scrape team data from specified source."""
+        return await self._scrape_cached(source, sport, team_name, 'team')
     
     async def scrape_player_data(self, source: str, sport: str, player_name: str) -> Dict[str, Any]:
         """Scrape player data from specified source."""
+        return await self._scrape_cached(source, sport, player_name, 'player')
+    
+    async def _scrape_cached(
+        self, source: str, sport: str, name: str, data_type: str
+    ) -> Dict[str, Any]:
+        """Scrape one team or player, serving and storing results via the cache."""
         if source not in self.scrapers:
             logger.warning(f"Scraper for {source} not implemented")
             return {}
         
-        cache_key = f"scrape:{source}:{sport}:{player_name}"
-        cached_data = self.cache.get(cache_key)
+        cache_key = f"scrape:{source}:{sport}:{name}"
+        cached_data = await asyncio.to_thread(self.cache.get, cache_key)
         if cached_data:
-            return cached_data
+            return {} if _is_miss(cached_data) else cached_data
         
+        data = await self._scrape(source, sport, name, data_type)
+        if data:
+            ttl = _jittered(SCRAPE_TTL, SCRAPE_TTL_JITTER)
+            await asyncio.to_thread(self.cache.set, cache_key, data, ttl)
+        else:
+            miss, ttl = self._miss_sentinel(), _jittered(MISS_TTL, MISS_TTL_JITTER)
+            await asyncio.to_thread(self.cache.set, cache_key, miss, ttl)
+        return data
+    
+    @staticmethod
+    def _miss_sentinel() -> Dict[str, Any]:
+        """Cache entry remembering that a scrape found nothing."""
+        return {MISS_MARKER: True, 'ts': time.time()}
+    
+    async def _scrape(
+        self, source: str, sport: str, name: str, data_type: str
+    ) -> Dict[str, Any]:
+        """Scrape one team or player from source, bypassing the cache."""
         try:
-            data = await self.scrapers[source](sport, player_name, 'player')
-            if data:
-                self.cache.set(cache_key, data, ttl=3600)
-            return data
+            return await self.scrapers[source](sport, name, data_type)
         except Exception as e:
-            logger.error(f"Error scraping {source} for {player_name}: {e}")
+            logger.error(f"Error scraping {source} for {name}: {e}")
             return {}
     
     async def _scrape_transfermarkt(self, sport: str, name: str, data_type: str) -> Dict[str, Any]:
         """Scrape data from Transfermarkt (soccer)."""
-        if sport not in ['mls', 'premier_league', 'la_liga', 'bundesliga', 'serie_a', 'champions_league']:
+        if sport not in SOCCER_SPORTS:
             return {}
         
-        self.rate_limiter.wait_if_needed('transfermarkt')
+        await self.rate_limiter.acquire('transfermarkt')
         
         # Search for the team/player
-        search_url = f"https://www.transfermarkt.com/schnellsuche/ergebnis/schnellsuche"
         search_params = {'query': name}
         
-        if not self.session:
-            return {}
-        
         try:
-            async with self.session.get(search_url, params=search_params) as response:
-                if response.status != 200:
-                    return {}
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Parse search results and get the first relevant result
-                if data_type == 'team':
-                    return self._parse_transfermarkt_team(soup, name)
-                else:
-                    return self._parse_transfermarkt_player(soup, name)
+            session = await self._get_session()
+            async with self._source_slots('transfermarkt'):
+                request = session.get(
+                    TRANSFERMARKT_SEARCH_URL,
+                    params=search_params,
+                    headers=SCRAPER_HEADERS
+                )
+                async with request as response:
+                    if response.status != 200:
+                        return {}
+                    
+                    html = await response.text()
+            
+            # Parse search results and get the first relevant result
+            if data_type == 'team':
+                return self._parse_transfermarkt_team(html, name)
+            else:
+                return self._parse_transfermarkt_player(html, name)
         
         except Exception as e:
             logger.error(f"Error scraping Transfermarkt: {e}")
@@ -132,30 +258,32 @@ class WebScraper:
     
     async def _scrape_fbref(self, sport: str, name: str, data_type: str) -> Dict[str, Any]:
         """Scrape data from FBRef (soccer statistics)."""
-        if sport not in ['mls', 'premier_league', 'la_liga', 'bundesliga', 'serie_a', 'champions_league']:
+        if sport not in SOCCER_SPORTS:
             return {}
         
-        self.rate_limiter.wait_if_needed('fbref')
+        await self.rate_limiter.acquire('fbref')
         
         # FBRef search
-        search_url = f"https://fbref.com/en/search/search.fcgi"
         search_params = {'search': name}
         
-        if not self.session:
-            return {}
-        
         try:
-            async with self.session.get(search_url, params=search_params) as response:
-                if response.status != 200:
-                    return {}
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                if data_type == 'team':
-                    return self._parse_fbref_team(soup, name)
-                else:
-                    return self._parse_fbref_player(soup, name)
+            session = await self._get_session()
+            async with self._source_slots('fbref'):
+                request = session.get(
+                    FBREF_SEARCH_URL,
+                    params=search_params,
+                    headers=SCRAPER_HEADERS
+                )
+                async with request as response:
+                    if response.status != 200:
+                        return {}
+                    
+                    html = await response.text()
+            
+            if data_type == 'team':
+                return self._parse_fbref_team(html, name)
+            else:
+                return self._parse_fbref_player(html, name)
         
         except Exception as e:
             logger.error(f"Error scraping FBRef: {e}")
@@ -166,27 +294,29 @@ class WebScraper:
         if sport != 'nba':
             return {}
         
-        self.rate_limiter.wait_if_needed('basketball_reference')
+        await self.rate_limiter.acquire('basketball_reference')
         
         # Basketball Reference search
-        search_url = f"https://www.basketball-reference.com/search/search.fcgi"
         search_params = {'search': name}
         
-        if not self.session:
-            return {}
-        
         try:
-            async with self.session.get(search_url, params=search_params) as response:
-                if response.status != 200:
-                    return {}
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                if data_type == 'team':
-                    return self._parse_basketball_ref_team(soup, name)
-                else:
-                    return self._parse_basketball_ref_player(soup, name)
+            session = await self._get_session()
+            async with self._source_slots('basketball_reference'):
+                request = session.get(
+                    BASKETBALL_REFERENCE_SEARCH_URL,
+                    params=search_params,
+                    headers=SCRAPER_HEADERS
+                )
+                async with request as response:
+                    if response.status != 200:
+                        return {}
+                    
+                    html = await response.text()
+            
+            if data_type == 'team':
+                return self._parse_basketball_ref_team(html, name)
+            else:
+                return self._parse_basketball_ref_player(html, name)
         
         except Exception as e:
             logger.error(f"Error scraping Basketball Reference: {e}")
@@ -208,7 +338,7 @@ class WebScraper:
         # Similar implementation to basketball reference
         return {}
     
-    def _parse_transfermarkt_team(self, soup: BeautifulSoup, team_name: str) -> Dict[str, Any]:
+    def _parse_transfermarkt_team(self, html: str, team_name: str) -> Dict[str, Any]:
         """Parse Transfermarkt team data."""
         # Implementation would parse team market value, squad info, etc.
         return {
@@ -220,7 +350,7 @@ class WebScraper:
             'foreigners': None
         }
     
-    def _parse_transfermarkt_player(self, soup: BeautifulSoup, player_name: str) -> Dict[str, Any]:
+    def _parse_transfermarkt_player(self, html: str, player_name: str) -> Dict[str, Any]:
         """Parse Transfermarkt player data."""
         # Implementation would parse player market value, transfer history, etc.
         return {
@@ -232,7 +362,7 @@ class WebScraper:
             'contract_expires': None
         }
     
-    def _parse_fbref_team(self, soup: BeautifulSoup, team_name: str) -> Dict[str, Any]:
+    def _parse_fbref_team(self, html: str, team_name: str) -> Dict[str, Any]:
         """Parse FBRef team statistics."""
         # Implementation would parse detailed team statistics
         return {
@@ -245,7 +375,7 @@ class WebScraper:
             'possession': None
         }
     
-    def _parse_fbref_player(self, soup: BeautifulSoup, player_name: str) -> Dict[str, Any]:
+    def _parse_fbref_player(self, html: str, player_name: str) -> Dict[str, Any]:
         """Parse FBRef player statistics."""
         # Implementation would parse detailed player statistics
         return {
@@ -258,7 +388,7 @@ class WebScraper:
             'minutes': None
         }
     
-    def _parse_basketball_ref_team(self, soup: BeautifulSoup, team_name: str) -> Dict[str, Any]:
+    def _parse_basketball_ref_team(self, html: str, team_name: str) -> Dict[str, Any]:
         """Parse Basketball Reference team statistics."""
         return {
             'source': 'basketball_reference',
@@ -269,7 +399,7 @@ class WebScraper:
             'field_goal_percentage': None
         }
     
-    def _parse_basketball_ref_player(self, soup: BeautifulSoup, player_name: str) -> Dict[str, Any]:
+    def _parse_basketball_ref_player(self, html: str, player_name: str) -> Dict[str, Any]:
         """Parse Basketball Reference player statistics."""
         return {
             'source': 'basketball_reference',
@@ -1,19 +1,27 @@
 """Machine learning models for sports prediction."""
 
+import importlib
+
 from .base_model import BaseModel
-from .pytorch_models import LSTMPredictor, TransformerPredictor
-from .tensorflow_models import TeamEmbeddingModel, PlayerEmbeddingModel
-from .lightgbm_model import LightGBMPredictor
-from .xgboost_model import XGBoostPredictor
-from .sklearn_models import SklearnPredictor
-from .meta_learner import MetaLearner
-from .ensemble import EnsemblePredictor
-from .feature_engineering import FeatureEngineer
+
+# Submodule defining each lazily imported model class
+_LAZY_IMPORTS = {
+    "LSTMPredictor": "pytorch_models",
+    "TransformerPredictor": "pytorch_models",
+    "TeamEmbeddingModel": "tensorflow_models",
+    "PlayerEmbeddingModel": "tensorflow_models",
+    "LightGBMPredictor": "lightgbm_model",
+    "XGBoostPredictor": "xgboost_model",
+    "SklearnPredictor": "sklearn_models",
+    "MetaLearner": "meta_learner",
+    "EnsemblePredictor": "ensemble",
+    "FeatureEngineer": "feature_engineering"
+}
 
 __all__ = [
     "BaseModel",
     "LSTMPredictor",
-    "TransformerPredictor", 
+    "TransformerPredictor",
     "TeamEmbeddingModel",
     "PlayerEmbeddingModel",
     "LightGBMPredictor",
@@ -23,3 +31,19 @@ __all__ = [
     "EnsemblePredictor",
     "FeatureEngineer"
 ]
+
+
+def __getattr__(name):
+    """Lazily import model classes on first access (PEP 562).
+
+    The model modules pull in PyTorch, TensorFlow and the boosting
+    libraries, so importing them eagerly would make every user of this
+    package pay for all of them.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -6,24 +6,38 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 import joblib
-import json
+import orjson
+import pickle
 from datetime import datetime
 from ..utils.logger import get_logger
 from ..config.settings import settings
 
 logger = get_logger(__name__)
 
+# Numeric dtype kinds (float, signed, unsigned, bool) cast to a model's dtype
+NUMERIC_KINDS = 'fiub'
+
+# Codec and level for saved models; lz4 decompresses faster than the disk
+# reads it saves, and joblib detects it on load so older plain dumps still load
+MODEL_COMPRESSION = ('lz4', 3)
+
 
 class BaseModel(ABC):
     """Base class for all prediction models."""
     
-    def __init__(self, model_name: str, sport: str):
+    def __init__(self, model_name: str, sport: str, dtype: Optional[np.dtype] = np.float32):
         self.model_name = model_name
         self.sport = sport
+        # Feature matrices are cast to this dtype (None keeps the input's);
+        # LightGBM and XGBoost take float32 without an internal copy
+        self.dtype = dtype
         self.model = None
         self.is_trained = False
         self.feature_columns = []
         self.target_columns = []
+        # Column index feature_columns was last read from; held so an
+        # identity check can skip re-listing the same frame's columns
+        self._feature_index: Optional[pd.Index] = None
         self.model_metadata = {
             'created_at': datetime.now().isoformat(),
             'model_name': model_name,
@@ -87,12 +101,14 @@ class BaseModel(ABC):
             'is_trained': self.is_trained
         }
         
-        joblib.dump(model_data, filepath)
+        joblib.dump(model_data, filepath, compress=MODEL_COMPRESSION, protocol=pickle.HIGHEST_PROTOCOL)
         
         # Save metadata separately as JSON
         metadata_path = filepath.with_suffix('.json')
-        with open(metadata_path, 'w') as f:
-            json.dump(self.model_metadata, f, indent=2)
+        metadata_path.write_bytes(orjson.dumps(
+            self.model_metadata,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
         
         logger.info(f"Model saved to {filepath}")
         return filepath
@@ -108,6 +124,7 @@ class BaseModel(ABC):
             self.model = model_data['model']
             self.model_metadata = model_data['metadata']
             self.feature_columns = model_data['feature_columns']
+            self._feature_index = None
             self.target_columns = model_data['target_columns']
             self.is_trained = model_data['is_trained']
             
@@ -128,34 +145,33 @@ class BaseModel(ABC):
     def _calculate_metrics(self, y_true: Union[np.ndarray, pd.Series], 
                           y_pred: np.ndarray, y_proba: np.ndarray) -> Dict[str, float]:
         """Calculate evaluation metrics."""
-        from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score, log_loss
+        from sklearn.metrics import precision_recall_fscore_support, roc_auc_score, log_loss
         
         metrics = {}
         
         try:
             # Convert to numpy arrays
-            y_true = np.array(y_true)
-            y_pred = np.array(y_pred)
+            y_true = np.asarray(y_true)
+            y_pred = np.asarray(y_pred)
             
             # Basic classification metrics
-            metrics['accuracy'] = accuracy_score(y_true, y_pred)
+            metrics['accuracy'] = float(np.mean(y_true == y_pred))
+            
+            # Handle multiclass vs binary classification; precision, recall
+            # and F1 come from one pass over the labels
+            multiclass = len(np.unique(y_true)) > 2
+            precision, recall, f1, _ = precision_recall_fscore_support(
+                y_true, y_pred, average='weighted' if multiclass else 'binary', zero_division=0
+            )
+            metrics['precision'] = precision
+            metrics['recall'] = recall
+            metrics['f1'] = f1
             
-            # Handle multiclass vs binary classification
-            if len(np.unique(y_true)) > 2:
-                # Multiclass
-                metrics['precision'] = precision_score(y_true, y_pred, average='weighted')
-                metrics['recall'] = recall_score(y_true, y_pred, average='weighted')
-                metrics['f1'] = f1_score(y_true, y_pred, average='weighted')
-                
+            if multiclass:
                 # AUC for multiclass (one-vs-rest)
                 if y_proba.shape[1] > 2:
                     metrics['auc'] = roc_auc_score(y_true, y_proba, multi_class='ovr', average='weighted')
             else:
-                # Binary classification
-                metrics['precision'] = precision_score(y_true, y_pred)
-                metrics['recall'] = recall_score(y_true, y_pred)
-                metrics['f1'] = f1_score(y_true, y_pred)
-                
                 # AUC for binary classification
                 if y_proba.shape[1] == 2:
                     metrics['auc'] = roc_auc_score(y_true, y_proba[:, 1])
@@ -174,12 +190,23 @@ class BaseModel(ABC):
         """Prepare data for training/prediction."""
         # Convert to numpy arrays
         if isinstance(X, pd.DataFrame):
-            self.feature_columns = X.columns.tolist()
-            X = X.values
+            if X.columns is not self._feature_index:
+                self.feature_columns = X.columns.tolist()
+                self._feature_index = X.columns
+            X = X.to_numpy(copy=False)
+        
+        X = np.asarray(X)
+        if self.dtype is not None and X.dtype.kind in NUMERIC_KINDS:
+            X = np.ascontiguousarray(X, dtype=self.dtype)
         
         if y is not None:
             if isinstance(y, pd.Series):
-                y = y.values
+                y = y.to_numpy(copy=False)
+            
+            # Class labels fit in int8, an eighth of the default int64
+            y = np.asarray(y)
+            if y.dtype.kind in 'iu' and y.size and y.min() >= 0 and y.max() <= np.iinfo(np.int8).max:
+                y = y.astype(np.int8)
         
         return X, y
     
@@ -178,16 +178,11 @@ class SportsPredictor:
     
     async def _analyze_teams(self, home_team_id: str, away_team_id: str) -> Dict[str, Any]:
         """Analyze both teams comprehensively."""
-        home_analysis_task = asyncio.create_task(
-            self.team_analyzer.analyze_team(home_team_id)
-        )
-        away_analysis_task = asyncio.create_task(
+        home_analysis, away_analysis = await asyncio.gather(
+            self.team_analyzer.analyze_team(home_team_id),
             self.team_analyzer.analyze_team(away_team_id)
         )
         
-        home_analysis = await home_analysis_task
-        away_analysis = await away_analysis_task
-        
         return {
             'home_team': home_analysis,
             'away_team': away_analysis,
@@ -4,17 +4,27 @@ import asyncio
 from typing import Dict, List, Any, Optional
 from telegram import Update, Bot
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters
-from telegram.error import TelegramError
+from telegram.error import NetworkError, TelegramError
 
 from .handlers import CommandHandlers, CallbackHandlers
 from .user_manager import UserManager
 from .formatters import MessageFormatter
 from ..prediction_engine.predictor import SportsPredictor
+from ..data_collection.http_client import close_session
 from ..utils.logger import get_logger
 from ..config.settings import settings
 
 logger = get_logger(__name__)
 
+# Update types the bot has handlers for; everything else is filtered server-side
+ALLOWED_UPDATES = ["message", "callback_query"]
+# Seconds a getUpdates long poll is held open while waiting for updates
+POLLING_TIMEOUT = 30
+# Attempts, and the cap on backoff seconds between them, when a network
+# error interrupts bot start-up
+STARTUP_RETRIES = 10
+STARTUP_RETRY_MAX_DELAY = 30
+
 
 class SportsPredictionBot:
     """Main Telegram bot for sports predictions."""
@@ -27,6 +37,7 @@ class SportsPredictionBot:
         self.formatter = MessageFormatter()
         self.command_handlers = None
         self.callback_handlers = None
+        self._stopped = False
         
         # Initialize predictors for supported sports
         for sport in settings.supported_sports:
@@ -37,7 +48,14 @@ class SportsPredictionBot:
         logger.info("Initializing Telegram bot")
         
         # Create application
-        self.application = Application.builder().token(self.token).build()
+        # Handle updates concurrently (bounded) so a slow prediction does not
+        # hold up every update queued behind it
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .concurrent_updates(settings.bot_concurrent_updates)
+            .build()
+        )
         
         # Initialize handlers
         self.command_handlers = CommandHandlers(self.predictors, self.user_manager, self.formatter)
@@ -90,14 +108,16 @@ class SportsPredictionBot:
         # Error handler
         self.application.add_error_handler(self._error_handler)
     
-    async def start_polling(self) -> None:
-        """Start the bot with polling."""
+    async def start_polling(self, timeout: int = POLLING_TIMEOUT, 
+                            allowed_updates: Optional[List[str]] = None) -> None:
+        """Start the bot with long polling."""
         logger.info("Starting bot with polling")
         
         try:
-            await self.application.initialize()
-            await self.application.start()
-            await self.application.updater.start_polling()
+            await self._start_application(lambda: self.application.updater.start_polling(
+                timeout=timeout,
+                allowed_updates=allowed_updates or ALLOWED_UPDATES
+            ))
             
             logger.info("Bot is running...")
             
@@ -116,14 +136,11 @@ class SportsPredictionBot:
         """Start the bot with webhook."""
         logger.info(f"Starting bot with webhook: {webhook_url}")
         
-        try:
-            await self.application.initialize()
-            await self.application.start()
-            
+        async def start_updates():
             # Set webhook
             await self.application.bot.set_webhook(
                 url=webhook_url,
-                allowed_updates=["message", "callback_query"]
+                allowed_updates=ALLOWED_UPDATES
             )
             
             # Start webhook
@@ -131,8 +148,12 @@ class SportsPredictionBot:
                 listen="0.0.0.0",
                 port=port,
                 url_path="webhook",
-                webhook_url=webhook_url
+                webhook_url=webhook_url,
+                allowed_updates=ALLOWED_UPDATES
             )
+        
+        try:
+            await self._start_application(start_updates)
             
             logger.info(f"Bot webhook started on port {port}")
             
@@ -140,14 +161,40 @@ class SportsPredictionBot:
             logger.error(f"Error starting webhook: {e}")
             raise
     
+    async def _start_application(self, start_updates) -> None:
+        """Start the application and update source, retrying network errors.
+        
+        Whatever already started is kept between attempts, so a transient
+        blip does not tear down the bot's HTTP connections and handler state.
+        """
+        for attempt in range(STARTUP_RETRIES):
+            try:
+                await self.application.initialize()
+                if not self.application.running:
+                    await self.application.start()
+                if not self.application.updater.running:
+                    await start_updates()
+                return
+            except NetworkError as e:
+                if attempt == STARTUP_RETRIES - 1:
+                    raise
+                delay = min(STARTUP_RETRY_MAX_DELAY, 2 ** attempt)
+                logger.warning(f"Network error starting bot (attempt {attempt + 1}), retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+    
     async def stop(self) -> None:
         """Stop the bot and cleanup."""
+        if self._stopped:
+            return
+        self._stopped = True
         logger.info("Stopping bot")
         
         try:
             if self.application:
-                await self.application.updater.stop()
-                await self.application.stop()
+                if self.application.updater.running:
+                    await self.application.updater.stop()
+                if self.application.running:
+                    await self.application.stop()
                 await self.application.shutdown()
             
             # Cleanup predictors
@@ -157,6 +204,8 @@ class SportsPredictionBot:
                 except Exception as e:
                     logger.error(f"Error cleaning up predictor: {e}")
             
+            await close_session()
+            
             logger.info("Bot stopped successfully")
             
         except Exception as e:
@@ -80,7 +80,7 @@ class CommandHandlers:
             # Parse sport and teams
             sport = args[0].lower()
             
-            if sport not in settings.supported_sports:
+            if sport not in settings.supported_sports_set:
                 await update.message.reply_text(
                     f"❌ Sport '{sport}' not supported.\n\n"
                     f"Supported sports: {', '.join(settings.supported_sports)}"
@@ -231,7 +231,7 @@ class CommandHandlers:
         
         sport = args[0].lower()
         
-        if sport not in settings.supported_sports:
+        if sport not in settings.supported_sports_set:
             await update.message.reply_text(
                 f"❌ Sport '{sport}' not supported.\n\n"
                 f"Supported sports: {', '.join(settings.supported_sports)}"
@@ -1,7 +1,8 @@
 """Utility modules for sports prediction system."""
 
 from .logger import get_logger
-from .cache import CacheManager
+from .cache import CacheManager, TwoTierCache
 from .rate_limiter import RateLimiter
+from .loop import use_uvloop
 
-__all__ = ["get_logger", "CacheManager", "RateLimiter"]
+__all__ = ["get_logger", "CacheManager", "TwoTierCache", "RateLimiter", "use_uvloop"]
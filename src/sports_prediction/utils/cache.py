@@ -2,7 +2,10 @@
 
 import json
 import pickle
-from typing import Any, Optional, Dict
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
 import redis
 from pathlib import Path
@@ -11,6 +14,10 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on how long the in-process tier serves a value without
+# consulting the shared backend, which may have been updated or expired
+LOCAL_CACHE_TTL = 300
+
 
 class CacheManager:
     """Manages caching for sports data and predictions."""
@@ -40,20 +47,91 @@ class CacheManager:
             logger.error(f"Error getting from cache: {e}")
         return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set value in cache with optional TTL."""
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None) -> bool:
+        """Set value in cache with optional TTL and invalidation tags."""
         try:
             ttl = ttl or settings.cache_ttl
             
             if self.redis_client:
                 serialized = pickle.dumps(value)
-                return self.redis_client.setex(key, ttl, serialized)
+                stored = self.redis_client.setex(key, ttl, serialized)
             else:
-                return self._set_to_file(key, value, ttl)
+                stored = self._set_to_file(key, value, ttl)
+            
+            if stored and tags:
+                self._add_tags(key, tags, ttl)
+            return stored
         except Exception as e:
             logger.error(f"Error setting cache: {e}")
             return False
     
+    def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values from cache in one round trip, omitting misses."""
+        if not keys:
+            return {}
+        
+        try:
+            if self.redis_client:
+                values = self.redis_client.mget(keys)
+                return {key: pickle.loads(value) for key, value in zip(keys, values) if value}
+            else:
+                found = {}
+                for key in keys:
+                    value = self._get_from_file(key)
+                    if value is not None:
+                        found[key] = value
+                return found
+        except Exception as e:
+            logger.error(f"Error getting many from cache: {e}")
+        return {}
+    
+    def _mget_with_ttl(self, keys: List[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """Get several values with the seconds each has left (None if it never expires), omitting misses."""
+        if not keys:
+            return {}
+        
+        try:
+            if self.redis_client:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.mget(keys)
+                for key in keys:
+                    pipe.pttl(key)
+                values, *ttls = pipe.execute()
+                return {
+                    key: (pickle.loads(value), ttl / 1000 if ttl >= 0 else None)
+                    for key, value, ttl in zip(keys, values, ttls) if value
+                }
+            else:
+                found = {}
+                now = datetime.now()
+                for key in keys:
+                    data = self._read_file(key)
+                    if data is not None:
+                        found[key] = (data['value'], (data['expires_at'] - now).total_seconds())
+                return found
+        except Exception as e:
+            logger.error(f"Error getting many from cache: {e}")
+        return {}
+    
+    def mset(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in cache with one TTL in one round trip."""
+        if not items:
+            return True
+        
+        try:
+            ttl = ttl or settings.cache_ttl
+            
+            if self.redis_client:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipe.setex(key, ttl, pickle.dumps(value))
+                return all(pipe.execute())
+            else:
+                return all([self._set_to_file(key, value, ttl) for key, value in items.items()])
+        except Exception as e:
+            logger.error(f"Error setting many in cache: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
         try:
@@ -65,8 +143,46 @@ class CacheManager:
             logger.error(f"Error deleting from cache: {e}")
             return False
     
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every entry set with the given tag, returning how many there were."""
+        tag_key = f"tag:{tag}"
+        try:
+            if self.redis_client:
+                keys = [key.decode() for key in self.redis_client.smembers(tag_key)]
+                self.redis_client.delete(tag_key)
+            else:
+                keys = list(self._get_from_file(tag_key) or ())
+                self._delete_from_file(tag_key)
+        except Exception as e:
+            logger.error(f"Error invalidating cache tag {tag}: {e}")
+            return 0
+        
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+    
+    def _add_tags(self, key: str, tags: List[str], ttl: int) -> None:
+        """Record key under each tag; a tag's index expires with its latest entry."""
+        if self.redis_client:
+            pipe = self.redis_client.pipeline()
+            for tag in tags:
+                pipe.sadd(f"tag:{tag}", key)
+                pipe.expire(f"tag:{tag}", ttl)
+            pipe.execute()
+        else:
+            for tag in tags:
+                tag_key = f"tag:{tag}"
+                keys = self._get_from_file(tag_key) or set()
+                keys.add(key)
+                self._set_to_file(tag_key, keys, ttl)
+    
     def _get_from_file(self, key: str) -> Optional[Any]:
         """Get value from file cache."""
+        data = self._read_file(key)
+        return data['value'] if data is not None else None
+    
+    def _read_file(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an unexpired file cache entry with its expiry time."""
         cache_file = self.file_cache_dir / f"{key}.cache"
         if not cache_file.exists():
             return None
@@ -80,7 +196,7 @@ class CacheManager:
                 cache_file.unlink()
                 return None
             
-            return data['value']
+            return data
         except Exception as e:
             logger.error(f"Error reading file cache: {e}")
             return None
@@ -133,3 +249,87 @@ class CacheManager:
                 logger.error(f"Error checking cache file {cache_file}: {e}")
                 # Remove corrupted cache files
                 cache_file.unlink()
+
+
+class TwoTierCache(CacheManager):
+    """Cache with a bounded in-process LRU tier in front of Redis/file storage.
+    
+    Hot keys are served from memory without a network hop; writes go
+    through to the backing store. The local tier is locked, so the cache
+    can be used from worker threads (e.g. via asyncio.to_thread) too.
+    """
+    
+    def __init__(self, max_local_size: Optional[int] = None, local_ttl: int = LOCAL_CACHE_TTL):
+        super().__init__()
+        self.max_local_size = max_local_size or settings.max_cache_size
+        self.local_ttl = local_ttl
+        self.local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._local_lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from the local tier, falling back to the backing store."""
+        with self._local_lock:
+            entry = self.local.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self.local.move_to_end(key)
+                    return value
+                del self.local[key]
+        
+        found = self._mget_with_ttl([key]).get(key)
+        if found is None:
+            return None
+        value, remaining = found
+        self._set_local(key, value, self._local_ttl_for(remaining))
+        return value
+    
+    def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values, fetching local misses in one backing-store round trip."""
+        found = {}
+        misses = []
+        now = time.monotonic()
+        with self._local_lock:
+            for key in keys:
+                entry = self.local.get(key)
+                if entry is not None and entry[0] > now:
+                    self.local.move_to_end(key)
+                    found[key] = entry[1]
+                else:
+                    misses.append(key)
+        
+        for key, (value, remaining) in self._mget_with_ttl(misses).items():
+            self._set_local(key, value, self._local_ttl_for(remaining))
+            found[key] = value
+        return found
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None) -> bool:
+        """Set value in both tiers."""
+        ttl = ttl or settings.cache_ttl
+        self._set_local(key, value, min(ttl, self.local_ttl))
+        return super().set(key, value, ttl, tags)
+    
+    def mset(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in both tiers."""
+        ttl = ttl or settings.cache_ttl
+        for key, value in items.items():
+            self._set_local(key, value, min(ttl, self.local_ttl))
+        return super().mset(items, ttl)
+    
+    def delete(self, key: str) -> bool:
+        """Delete key from both tiers."""
+        with self._local_lock:
+            self.local.pop(key, None)
+        return super().delete(key)
+    
+    def _local_ttl_for(self, remaining: Optional[float]) -> float:
+        """Cap a local copy's TTL at the backing entry's remaining lifetime."""
+        return self.local_ttl if remaining is None else min(self.local_ttl, remaining)
+    
+    def _set_local(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value in the local tier, evicting least recently used keys."""
+        with self._local_lock:
+            self.local[key] = (time.monotonic() + ttl, value)
+            self.local.move_to_end(key)
+            while len(self.local) > self.max_local_size:
+                self.local.popitem(last=False)
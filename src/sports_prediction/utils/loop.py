@@ -0,0 +1,26 @@
+"""Event loop selection for the command-line and web server entry points."""
+
+import asyncio
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def use_uvloop() -> bool:
+    """Run event loops created from now on with uvloop where it is installed.
+    
+    Entry points call this right before starting their loop, so importing
+    them never replaces the process-wide event loop policy.
+    
+    Returns:
+        True if uvloop is in use
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop policy")
+    return True
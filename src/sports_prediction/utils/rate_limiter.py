@@ -1,7 +1,8 @@
 """Rate limiting utilities for API calls and web scraping."""
 
+import asyncio
 import time
-from typing import Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 from ..config.settings import settings
@@ -17,6 +18,60 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute or settings.api_rate_limit
         self.request_times: Dict[str, deque] = defaultdict(deque)
         self.last_request_time: Dict[str, float] = {}
+        # Token buckets for async callers: identifier -> tokens/last_refill/lock
+        self.buckets: Dict[str, Dict[str, Any]] = {}
+    
+    def _get_bucket(self, identifier: str) -> Dict[str, Any]:
+        """Get or create the token bucket for an identifier."""
+        bucket = self.buckets.get(identifier)
+        if bucket is None:
+            bucket = {
+                'tokens': float(self.requests_per_minute),
+                'last_refill': time.monotonic(),
+                'lock': asyncio.Lock()
+            }
+            self.buckets[identifier] = bucket
+        return bucket
+    
+    def _refill(self, bucket: Dict[str, Any]) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        rate = self.requests_per_minute / 60
+        bucket['tokens'] = min(
+            float(self.requests_per_minute),
+            bucket['tokens'] + (now - bucket['last_refill']) * rate
+        )
+        bucket['last_refill'] = now
+    
+    async def acquire(self, identifier: str = "default") -> None:
+        """Wait for a request slot without blocking the event loop."""
+        bucket = self._get_bucket(identifier)
+        
+        async with bucket['lock']:
+            self._refill(bucket)
+            while bucket['tokens'] < 1:
+                wait_time = (1 - bucket['tokens']) / (self.requests_per_minute / 60)
+                logger.info(f"Rate limit reached for {identifier}, waiting {wait_time:.2f} seconds")
+                await asyncio.sleep(wait_time)
+                self._refill(bucket)
+            bucket['tokens'] -= 1
+        
+        self.last_request_time[identifier] = time.time()
+    
+    def update_from_headers(self, identifier: str, headers: Mapping[str, str]) -> None:
+        """Clamp the bucket to the quota the server reports as remaining."""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        
+        try:
+            remaining_requests = float(remaining)
+        except ValueError:
+            return
+        
+        bucket = self._get_bucket(identifier)
+        self._refill(bucket)
+        bucket['tokens'] = min(bucket['tokens'], remaining_requests)
     
     def wait_if_needed(self, identifier: str = "default") -> None:
         """Wait if rate limit would be exceeded."""
@@ -59,3 +114,4 @@ class RateLimiter:
             self.request_times[identifier].clear()
         if identifier in self.last_request_time:
             del self.last_request_time[identifier]
+        self.buckets.pop(identifier, None)
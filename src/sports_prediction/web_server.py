@@ -10,6 +10,7 @@ import logging
 from .telegram_bot.bot import SportsPredictionBot
 from .config.settings import settings
 from .utils.logger import get_logger
+from .utils.loop import use_uvloop
 
 logger = get_logger(__name__)
 
@@ -160,6 +161,9 @@ async def run_server(host: str = "0.0.0.0", port: int = 8000):
 
 def run_server_sync(host: str = "0.0.0.0", port: int = 8000):
     """Run the server synchronously."""
+    # Serve the webhook and the bot's collectors on libuv where uvloop is available
+    use_uvloop()
+    
     asyncio.run(run_server(host, port))
 
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+"""Shared pytest configuration."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+
+@pytest.fixture
+def file_cache(tmp_path, monkeypatch):
+    """Make caches created during the test file-backed in a temporary directory."""
+    from sports_prediction.utils import cache as cache_module
+
+    def no_redis(url):
+        raise ConnectionError("Redis is not used in tests")
+
+    monkeypatch.setattr(cache_module.redis, "from_url", no_redis)
+    monkeypatch.setitem(cache_module.settings.__dict__, "cache_dir", tmp_path)
+    return tmp_path
@@ -0,0 +1,196 @@
+"""Tests for BaseDataCollector request handling."""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("redis")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("pandas")
+pytest.importorskip("loguru")
+pytest.importorskip("pytest_asyncio")
+
+import orjson
+
+from sports_prediction.data_collection.base_collector import BaseDataCollector
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = orjson.dumps(body) if body is not None else b""
+
+    async def read(self):
+        return self._body
+
+
+class FakeRequest:
+    """Context manager taking a session's next queued response, delivered after its delay."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        response = self.session.responses.pop(0)
+        await asyncio.sleep(self.session.delay)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeSession:
+    """Session answering each GET with the next queued response (or exception)."""
+
+    def __init__(self, *responses, delay=0.0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.requests = []
+
+    def get(self, url, params=None, headers=None):
+        self.requests.append((url, headers))
+        return FakeRequest(self)
+
+
+class FakeCollector(BaseDataCollector):
+    """Concrete collector; only make_request is exercised."""
+
+    async def get_team_stats(self, sport, team_id, season):
+        return {}
+
+    async def get_player_stats(self, sport, player_id, season):
+        return {}
+
+    async def get_match_history(self, sport, team1_id, team2_id, limit=10):
+        return []
+
+    async def get_upcoming_matches(self, sport, days_ahead=7):
+        return []
+
+    async def get_recent_matches(self, sport, team_id, limit=10):
+        return []
+
+
+@pytest.fixture
+def collector(file_cache):
+    """A collector with a file-backed cache in a temporary directory."""
+    collector = FakeCollector("fake")
+    collector.base_delay = 0.01
+    return collector
+
+
+def test_cache_ttl_follows_key_kind(collector):
+    assert collector._cache_ttl(collector.get_cache_key("live_odds", "nba")) == 5
+    assert collector._cache_ttl(collector.get_cache_key("team_stats", "nba", "1", "2024")) == 21600
+    assert collector._cache_ttl(collector.get_cache_key("unknown", "nba")) is None
+
+
+@pytest.mark.asyncio
+async def test_live_odds_are_not_held_locally_past_their_ttl(collector):
+    collector.session = FakeSession(FakeResponse(200, {"odds": 2.1}))
+    key = collector.get_cache_key("live_odds", "nba")
+
+    assert await collector.make_request("https://api.test/odds", cache_key=key) == {"odds": 2.1}
+    assert collector.cache.local[key][0] <= time.monotonic() + 5
+
+    # A read-through from the backing store is capped the same way
+    collector.cache.local.clear()
+    assert collector.cache.get(key) == {"odds": 2.1}
+    assert collector.cache.local[key][0] <= time.monotonic() + 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch(collector):
+    collector.session = FakeSession(FakeResponse(200, {"id": 1}), delay=0.05)
+    key = collector.get_cache_key("team_stats", "nba", "1", "2024")
+
+    results = await asyncio.gather(*[
+        collector.make_request("https://api.test/team", cache_key=key) for _ in range(5)
+    ])
+
+    assert results == [{"id": 1}] * 5
+    assert len(collector.session.requests) == 1
+    assert key not in BaseDataCollector._inflight
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_reaches_every_joined_request(collector, monkeypatch):
+    async def failing_fetch(url, params, cache_key):
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    monkeypatch.setattr(collector, "_fetch_within_budget", failing_fetch)
+    key = collector.get_cache_key("team_stats", "nba", "2", "2024")
+
+    results = await asyncio.gather(*[
+        collector.make_request("https://api.test/team", cache_key=key) for _ in range(3)
+    ], return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert key not in BaseDataCollector._inflight
+
+
+@pytest.mark.asyncio
+async def test_joined_request_refetches_when_fetching_caller_is_cancelled(collector):
+    collector.session = FakeSession(FakeResponse(200, {"n": 1}), FakeResponse(200, {"n": 2}), delay=0.05)
+    key = collector.get_cache_key("team_stats", "nba", "3", "2024")
+
+    leader = asyncio.create_task(collector.make_request("https://api.test/team", cache_key=key))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(collector.make_request("https://api.test/team", cache_key=key))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await joiner == {"n": 2}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_cancelling_joined_request_leaves_fetch_running(collector):
+    collector.session = FakeSession(FakeResponse(200, {"n": 1}), delay=0.05)
+    key = collector.get_cache_key("team_stats", "nba", "4", "2024")
+
+    leader = asyncio.create_task(collector.make_request("https://api.test/team", cache_key=key))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(collector.make_request("https://api.test/team", cache_key=key))
+    await asyncio.sleep(0.01)
+    joiner.cancel()
+
+    assert await leader == {"n": 1}
+    with pytest.raises(asyncio.CancelledError):
+        await joiner
+
+
+@pytest.mark.asyncio
+async def test_not_modified_response_serves_stale_copy(collector):
+    key = collector.get_cache_key("team_stats", "nba", "5", "2024")
+    collector.session = FakeSession(
+        FakeResponse(200, {"rank": 1}, headers={"ETag": '"v1"'}),
+        FakeResponse(304)
+    )
+
+    assert await collector.make_request("https://api.test/team", cache_key=key) == {"rank": 1}
+    collector.cache.delete(key)
+
+    assert await collector.make_request("https://api.test/team", cache_key=key) == {"rank": 1}
+    assert collector.session.requests[1][1] == {"If-None-Match": '"v1"'}
+    assert collector.cache.get(key) == {"rank": 1}
+
+
+@pytest.mark.asyncio
+async def test_retryable_status_is_retried(collector):
+    collector.session = FakeSession(
+        FakeResponse(503, headers={"Retry-After": "0"}),
+        FakeResponse(200, {"ok": True})
+    )
+
+    assert await collector.make_request("https://api.test/flaky") == {"ok": True}
+    assert len(collector.session.requests) == 2
@@ -0,0 +1,86 @@
+"""Tests for the cache utilities."""
+
+import time
+
+import pytest
+
+pytest.importorskip("redis")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("loguru")
+
+from sports_prediction.utils.cache import CacheManager, TwoTierCache
+
+
+@pytest.fixture
+def cache(file_cache):
+    """A TwoTierCache backed by files in a temporary directory."""
+    return TwoTierCache(local_ttl=300)
+
+
+def test_get_caps_local_copy_at_backend_ttl(cache):
+    # Written by another worker, so only the backing store has it
+    CacheManager.set(cache, "live_odds", {"odds": 1.5}, ttl=1)
+
+    assert cache.get("live_odds") == {"odds": 1.5}
+    assert cache.local["live_odds"][0] <= time.monotonic() + 1
+
+    time.sleep(1.1)
+    assert cache.get("live_odds") is None
+
+
+def test_mget_caps_local_copies_at_backend_ttl(cache):
+    CacheManager.set(cache, "short", "a", ttl=1)
+    CacheManager.set(cache, "long", "b", ttl=3600)
+
+    assert cache.mget(["short", "long", "missing"]) == {"short": "a", "long": "b"}
+    assert cache.local["short"][0] <= time.monotonic() + 1
+    assert cache.local["long"][0] > time.monotonic() + 299
+
+    time.sleep(1.1)
+    assert cache.mget(["short", "long"]) == {"long": "b"}
+
+
+def test_set_caps_local_copy_at_entry_ttl(cache):
+    cache.set("upcoming_odds", [1, 2], ttl=60)
+
+    assert cache.local["upcoming_odds"][0] <= time.monotonic() + 60
+    assert cache.get("upcoming_odds") == [1, 2]
+
+
+def test_local_tier_evicts_least_recently_used(cache):
+    cache.max_local_size = 2
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert list(cache.local) == ["a", "c"]
+    # Evicted keys are still served from the backing store
+    assert cache.get("b") == 2
+
+
+def test_mset_writes_both_tiers(cache):
+    assert cache.mset({"x": 1, "y": 2}, ttl=60)
+
+    assert set(cache.local) == {"x", "y"}
+    assert CacheManager.mget(cache, ["x", "y"]) == {"x": 1, "y": 2}
+
+
+def test_delete_removes_both_tiers(cache):
+    cache.set("k", "v")
+    assert cache.delete("k")
+
+    assert "k" not in cache.local
+    assert cache.get("k") is None
+
+
+def test_invalidate_tag_deletes_tagged_entries(cache):
+    cache.set("nba:1", "a", tags=["nba"])
+    cache.set("nba:2", "b", tags=["nba"])
+    cache.set("nfl:1", "c", tags=["nfl"])
+
+    assert cache.invalidate_tag("nba") == 2
+    assert cache.get("nba:1") is None
+    assert cache.get("nba:2") is None
+    assert cache.get("nfl:1") == "c"
+    assert cache.invalidate_tag("nba") == 0
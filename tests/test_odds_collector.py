@@ -0,0 +1,79 @@
+"""Tests for OddsCollector arbitrage ranking."""
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("redis")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("pandas")
+pytest.importorskip("loguru")
+pytest.importorskip("pytest_asyncio")
+
+from sports_prediction.data_collection.odds_collector import BOOKMAKERS, OddsCollector
+
+
+def make_match(match_id, home_price, away_price, home_book='draftkings', away_book='fanduel'):
+    """An upcoming match whose best home and away prices come from two bookmakers."""
+    def bookmaker(key, home, away):
+        return {
+            'key': key,
+            'title': key.title(),
+            'markets': [{'key': 'h2h', 'outcomes': [
+                {'name': 'Home', 'price': home},
+                {'name': 'Away', 'price': away},
+            ]}]
+        }
+
+    return {
+        'id': match_id,
+        'home_team': 'Home',
+        'away_team': 'Away',
+        'bookmakers': [bookmaker(home_book, home_price, 1.5), bookmaker(away_book, 1.5, away_price)]
+    }
+
+
+@pytest.fixture
+def collector(file_cache, monkeypatch):
+    """An odds collector serving fixed upcoming matches per sport."""
+    collector = OddsCollector()
+    collector.supported_sports = frozenset({'nba', 'nfl'})
+    matches = {
+        'nba': [make_match('nba-1', 2.1, 2.1), make_match('nba-2', 2.5, 2.5), make_match('nba-3', 1.8, 1.8)],
+        'nfl': [make_match('nfl-1', 2.3, 2.3), make_match('nfl-2', 2.2, 2.2, away_book='smallbook')],
+    }
+
+    async def get_upcoming_matches(sport, days_ahead=7):
+        return matches.get(sport, [])
+
+    monkeypatch.setattr(collector, "get_upcoming_matches", get_upcoming_matches)
+    return collector
+
+
+@pytest.mark.asyncio
+async def test_opportunities_are_ranked_by_profit_margin(collector):
+    opportunities = await collector.get_arbitrage_opportunities('nba')
+
+    assert [opportunity['event_id'] for opportunity in opportunities] == ['nba-2', 'nba-1']
+
+
+@pytest.mark.asyncio
+async def test_top_k_keeps_only_the_best(collector):
+    opportunities = await collector.get_arbitrage_opportunities('nba', top_k=1)
+
+    assert [opportunity['event_id'] for opportunity in opportunities] == ['nba-2']
+
+
+@pytest.mark.asyncio
+async def test_many_sports_are_merged_in_rank_order(collector):
+    opportunities = await collector.get_many_arbitrage_opportunities(['nba', 'nfl', 'mlb'], top_k=3)
+
+    assert [opportunity['event_id'] for opportunity in opportunities] == ['nba-2', 'nfl-1', 'nfl-2']
+
+
+@pytest.mark.asyncio
+async def test_every_bookmaker_is_scanned_unless_restricted(collector):
+    everyone = await collector.get_arbitrage_opportunities('nfl')
+    popular = await collector.get_arbitrage_opportunities('nfl', bookmakers=BOOKMAKERS)
+
+    assert [opportunity['event_id'] for opportunity in everyone] == ['nfl-1', 'nfl-2']
+    assert [opportunity['event_id'] for opportunity in popular] == ['nfl-1']
@@ -0,0 +1,94 @@
+"""Tests for the async token-bucket rate limiter."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("redis")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("loguru")
+pytest.importorskip("pytest_asyncio")
+
+from sports_prediction.utils import rate_limiter as rate_limiter_module
+from sports_prediction.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps or a test advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", SimpleNamespace(monotonic=clock.monotonic, time=time.time))
+    monkeypatch.setattr(rate_limiter_module, "asyncio", SimpleNamespace(sleep=clock.sleep, Lock=asyncio.Lock))
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_acquire_spends_burst_then_waits_for_refill(clock):
+    limiter = RateLimiter(requests_per_minute=60)
+
+    for _ in range(60):
+        await limiter.acquire("api")
+    assert clock.slept == []
+
+    await limiter.acquire("api")
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+@pytest.mark.asyncio
+async def test_refill_is_capped_at_capacity(clock):
+    limiter = RateLimiter(requests_per_minute=60)
+    await limiter.acquire("api")
+
+    clock.now += 3600
+    limiter._refill(limiter.buckets["api"])
+    assert limiter.buckets["api"]["tokens"] == 60
+
+
+@pytest.mark.asyncio
+async def test_identifiers_have_separate_buckets(clock):
+    limiter = RateLimiter(requests_per_minute=1)
+
+    await limiter.acquire("espn")
+    await limiter.acquire("odds")
+    assert clock.slept == []
+
+
+@pytest.mark.asyncio
+async def test_update_from_headers_clamps_to_server_quota(clock):
+    limiter = RateLimiter(requests_per_minute=60)
+
+    limiter.update_from_headers("api", {"X-RateLimit-Remaining": "0"})
+    await limiter.acquire("api")
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+def test_update_from_headers_never_raises_tokens(clock):
+    limiter = RateLimiter(requests_per_minute=60)
+
+    limiter.update_from_headers("api", {"X-RateLimit-Remaining": "10"})
+    limiter.update_from_headers("api", {"X-RateLimit-Remaining": "500"})
+    assert limiter.buckets["api"]["tokens"] == 10
+
+
+def test_update_from_headers_ignores_missing_or_invalid_quota(clock):
+    limiter = RateLimiter(requests_per_minute=60)
+
+    limiter.update_from_headers("api", {})
+    limiter.update_from_headers("api", {"X-RateLimit-Remaining": "unknown"})
+    assert "api" not in limiter.buckets
@@ -0,0 +1,69 @@
+"""Tests for WebScraper result caching."""
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("redis")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("pandas")
+pytest.importorskip("loguru")
+pytest.importorskip("pytest_asyncio")
+
+from sports_prediction.data_collection.web_scraper import WebScraper, _is_miss
+
+
+@pytest.fixture
+def scraper(file_cache):
+    """A scraper whose fbref source is faked and whose cache is file-backed."""
+    scraper = WebScraper()
+    scraper.calls = []
+
+    async def fake_fbref(sport, name, data_type):
+        scraper.calls.append(name)
+        if name == "Unknown FC":
+            return {}
+        return {'source': 'fbref', 'team_name': name}
+
+    scraper.scrapers['fbref'] = fake_fbref
+    return scraper
+
+
+@pytest.mark.asyncio
+async def test_scrape_result_is_cached(scraper):
+    first = await scraper.scrape_team_data('fbref', 'mls', 'Austin FC')
+    second = await scraper.scrape_team_data('fbref', 'mls', 'Austin FC')
+
+    assert first == second == {'source': 'fbref', 'team_name': 'Austin FC'}
+    assert scraper.calls == ['Austin FC']
+
+
+@pytest.mark.asyncio
+async def test_empty_scrape_is_remembered_as_a_miss(scraper):
+    assert await scraper.scrape_team_data('fbref', 'mls', 'Unknown FC') == {}
+    assert await scraper.scrape_team_data('fbref', 'mls', 'Unknown FC') == {}
+
+    assert scraper.calls == ['Unknown FC']
+    assert _is_miss(scraper.cache.get('scrape:fbref:mls:Unknown FC'))
+
+
+@pytest.mark.asyncio
+async def test_scrape_many_scrapes_each_distinct_miss_once(scraper):
+    requests = [
+        ('fbref', 'mls', 'Austin FC'),
+        ('fbref', 'mls', 'Austin FC'),
+        ('fbref', 'mls', 'Unknown FC'),
+        ('not_a_source', 'mls', 'Austin FC'),
+    ]
+
+    results = await scraper.scrape_many(requests)
+    assert results == [
+        {'source': 'fbref', 'team_name': 'Austin FC'},
+        {'source': 'fbref', 'team_name': 'Austin FC'},
+        {},
+        {},
+    ]
+    assert sorted(scraper.calls) == ['Austin FC', 'Unknown FC']
+
+    # Both the result and the miss are served from the cache next time
+    assert await scraper.scrape_many(requests) == results
+    assert len(scraper.calls) == 2